@@ -33,6 +33,7 @@ from .models import (
     GradeDetail,
     GradeOutput,
     GradingRule,
+    JsonExportConfig,
     KeywordRule,
     LengthRule,
     MultipleChoiceRule,
@@ -122,6 +123,7 @@ __all__ = [
     "DetailedCsvExportConfig",
     "CanvasExportConfig",
     "YamlExportConfig",
+    "JsonExportConfig",
     "ExportConfig",
     # Rule type unions
     "GradingRule",
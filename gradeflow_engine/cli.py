@@ -103,25 +103,30 @@ def grade(
         rubric_obj = load_rubric(str(rubric))
         submissions_list = load_submissions_csv(str(submissions), student_id_col=student_id_col)
 
-        # Grade submissions with progress tracking (always show progress)
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=console,
-        ) as progress:
-            task = progress.add_task(
-                f"[cyan]Grading {len(submissions_list)} submissions...",
-                total=len(submissions_list),
-            )
-
-            def update_progress(current: int, total: int):
-                progress.update(task, completed=current)
-
-            results = grade_submissions(
-                rubric_obj, submissions_list, progress_callback=update_progress
-            )
+        if not submissions_list:
+            # Nothing to grade; skip the progress display but still write empty results
+            console.print("[yellow]No submissions to grade[/yellow]")
+            results = grade_submissions(rubric_obj, submissions_list)
+        else:
+            # Grade submissions with progress tracking
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TaskProgressColumn(),
+                console=console,
+            ) as progress:
+                task = progress.add_task(
+                    f"[cyan]Grading {len(submissions_list)} submissions...",
+                    total=len(submissions_list),
+                )
+
+                def update_progress(current: int, total: int):
+                    progress.update(task, completed=current)
+
+                results = grade_submissions(
+                    rubric_obj, submissions_list, progress_callback=update_progress
+                )
 
         console.print(f"[green]✓[/green] Graded {len(results.results)} students")
 
@@ -6,7 +6,9 @@ Includes the main grading logic and public API functions.
 """
 
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
 from pydantic import ValidationError
 
@@ -21,16 +23,27 @@ from .models import (
     StudentResult,
     Submission,
 )
+from .rules.base import grading_pass
 from .rules.registry import rule_registry
 from .sandbox import SandboxExecutionError, SandboxTimeoutError
 
 logger = logging.getLogger(__name__)
 
+# Smallest batch handed to a process pool. Starting a pool costs ~9 ms with fork
+# (far more with spawn), and each submission pays ~85 us to pickle it out and
+# its result back, so smaller batches are always graded inline.
+_MIN_BATCH_FOR_POOL = 1000
+
+# Chunks queued per worker: enough to rebalance uneven rules, few enough that
+# per-chunk IPC stays small
+_CHUNKS_PER_WORKER = 4
+
 
 def grade(
     rubric: Rubric,
     submissions: list[Submission],
     progress_callback: Callable[[int, int], None] | None = None,
+    workers: int = 1,
 ) -> GradeOutput:
     """
     Grade submissions using a rubric.
@@ -42,6 +55,8 @@ def grade(
         rubric: The grading rubric containing all rules
         submissions: List of student submissions to grade
         progress_callback: Optional callback function(current, total) for progress updates
+        workers: Number of worker processes; a pool is used only for batches of at least
+            1000 submissions
 
     Returns:
         GradeOutput containing results for all students
@@ -73,15 +88,70 @@ def grade(
         >>> def on_progress(current, total):
         ...     print(f"Grading {current}/{total}")
         >>> results = grade(rubric, submissions, progress_callback=on_progress)
+
+        Grading a large batch in parallel:
+        >>> results = grade(rubric, submissions, workers=4)
     """
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+
     logger.info(f"Grading {len(submissions)} submissions using rubric '{rubric.name}'")
     logger.debug(f"Rubric has {len(rubric.rules)} rules")
 
-    results = []
+    # Processor caches (e.g. similarity scores) live only for this call
+    with grading_pass():
+        # Small batches are graded inline; see _MIN_BATCH_FOR_POOL
+        if workers > 1 and len(submissions) >= _MIN_BATCH_FOR_POOL:
+            # Processes, not threads: the programmable-rule sandbox relies on SIGALRM
+            # (main thread only) and a process-wide RLIMIT_AS
+            logger.debug(f"Grading with {workers} worker processes")
+            chunksize = max(1, len(submissions) // (workers * _CHUNKS_PER_WORKER))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = _collect_results(
+                    submissions,
+                    executor.map(
+                        partial(_grade_single_submission, rubric), submissions, chunksize=chunksize
+                    ),
+                    progress_callback,
+                )
+        else:
+            results = _collect_results(
+                submissions,
+                (_grade_single_submission(rubric, submission) for submission in submissions),
+                progress_callback,
+            )
+
+    logger.info(f"Completed grading {len(results)} submissions")
+
+    return GradeOutput(
+        results=results,
+        metadata={
+            "rubric_name": rubric.name,
+            "total_submissions": len(submissions),
+        },
+    )
 
-    for i, submission in enumerate(submissions, start=1):
-        logger.debug(f"Grading submission for student {submission.student_id}")
-        student_result = _grade_single_submission(rubric, submission)
+
+def _collect_results(
+    submissions: list[Submission],
+    student_results: Iterable[StudentResult],
+    progress_callback: Callable[[int, int], None] | None,
+) -> list[StudentResult]:
+    """
+    Gather results in submission order, reporting progress as each one arrives.
+
+    Args:
+        submissions: The submissions being graded
+        student_results: Results for those submissions, in the same order
+        progress_callback: Optional callback function(current, total)
+
+    Returns:
+        List of StudentResult, one per submission
+    """
+    results = []
+    for i, (submission, student_result) in enumerate(
+        zip(submissions, student_results, strict=True), start=1
+    ):
         results.append(student_result)
         logger.debug(
             f"Student {submission.student_id}: "
@@ -95,16 +165,7 @@ def grade(
                 progress_callback(i, len(submissions))
             except Exception as e:
                 logger.warning(f"Progress callback failed: {e}")
-
-    logger.info(f"Completed grading {len(results)} submissions")
-
-    return GradeOutput(
-        results=results,
-        metadata={
-            "rubric_name": rubric.name,
-            "total_submissions": len(submissions),
-        },
-    )
+    return results
 
 
 def _grade_single_submission(rubric: Rubric, submission: Submission) -> StudentResult:
@@ -118,6 +179,7 @@ def _grade_single_submission(rubric: Rubric, submission: Submission) -> StudentR
     Returns:
         StudentResult with detailed grading information
     """
+    logger.debug(f"Grading submission for student {submission.student_id}")
     all_details: list[GradeDetail] = []
 
     for rule in rubric.rules:
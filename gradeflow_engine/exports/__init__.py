@@ -11,12 +11,17 @@ from .csv import (
     detailed_csv_export,
     summary_csv_export,
 )
+from .json import JsonExportConfig, json_export
 from .registry import ExportRegistry, export_registry
-from .utils import Mapper, base_csv_export, write_csv, write_yaml
+from .utils import Mapper, base_csv_export, write_csv, write_json, write_yaml
 from .yaml import YamlExportConfig, yaml_export
 
 ExportConfig = Annotated[
-    SummaryCsvExportConfig | DetailedCsvExportConfig | CanvasExportConfig | YamlExportConfig,
+    SummaryCsvExportConfig
+    | DetailedCsvExportConfig
+    | CanvasExportConfig
+    | YamlExportConfig
+    | JsonExportConfig,
     Discriminator("type"),
 ]
 
@@ -28,13 +33,16 @@ __all__ = [
     "detailed_csv_export",
     "canvas_export",
     "write_csv",
+    "write_json",
     "write_yaml",
     "SummaryCsvExportConfig",
     "DetailedCsvExportConfig",
     "CanvasExportConfig",
     "YamlExportConfig",
+    "JsonExportConfig",
     "ExportConfig",
     "yaml_export",
+    "json_export",
     "export_registry",
     "ExportRegistry",
 ]
@@ -68,7 +68,7 @@ def detailed_csv_export(
     ]
 
     def make_getter_for_qattr(qid: str, attr: str):
-        def getter(lst: list[GradeDetail]):
+        def getter(lst: "list[GradeDetail]"):
             if not lst:
                 return None
             for item in lst:
@@ -0,0 +1,27 @@
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+from pydantic import Field
+
+from .base import BaseExportConfig
+from .registry import export_registry as registry
+from .utils import write_json
+
+if TYPE_CHECKING:
+    from ..models import GradeOutput
+
+
+class JsonExportConfig(BaseExportConfig):
+    type: Literal["json"] = "json"
+    indent: int | None = Field(
+        default=2, description="JSON indentation level (None for compact output)"
+    )
+
+
+def json_export(results: "GradeOutput", file_path: Path | str, config: "JsonExportConfig") -> None:
+    """Export the GradeOutput to JSON using the provided config."""
+    data = results.model_dump(mode="json")
+    write_json(data, str(file_path), indent=getattr(config, "indent", 2))
+
+
+registry.register("json", json_export, JsonExportConfig)
@@ -1,12 +1,13 @@
 """
 Shared I/O utilities for export modules.
 
-Provides helpers to ensure parent directories exist and to write YAML
-and CSV files in a small, well-tested way so other export modules can
+Provides helpers to ensure parent directories exist and to write YAML,
+JSON and CSV files in a small, well-tested way so other export modules can
 be thin wrappers around these helpers.
 """
 
 import csv
+import json
 from collections.abc import Callable, Iterable, Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -36,6 +37,12 @@ def write_yaml(data: dict[str, Any], file_path: str, indent: int = 2) -> None:
         yaml.dump(data, f, default_flow_style=False, sort_keys=False, indent=indent)
 
 
+def write_json(data: dict[str, Any], file_path: str, indent: int | None = 2) -> None:
+    path = _ensure_parent_dir(file_path)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=indent)
+
+
 def write_csv(
     header: Sequence[str], rows: Iterable[Sequence[Any]], file_path: str, encoding: str = "utf-8"
 ) -> None:
@@ -16,6 +16,13 @@ from .exports import ExportConfig, export_registry
 from .models import GradeOutput, Rubric, Submission
 from .schema import AssessmentSchema
 
+# Parse with LibYAML when available. Writing stays on the pure-Python emitter,
+# whose line wrapping users see in saved rubrics and schemas.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 
 # Helper functions to reduce duplication
 def _ensure_parent_dir(file_path: str) -> Path:
@@ -53,7 +60,7 @@ def load_rubric(file_path: str) -> Rubric:
 
     try:
         with open(path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
     except yaml.YAMLError as e:
         raise ValueError(f"Invalid YAML format in {file_path}: {str(e)}") from e
     except Exception as e:
@@ -191,7 +198,7 @@ def load_schema(file_path: str) -> AssessmentSchema:
 
     try:
         with open(path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
 
         if not isinstance(data, dict):
             raise ValueError(f"Invalid YAML format in {file_path}")
@@ -14,6 +14,7 @@ from .exports import (
     CanvasExportConfig,
     DetailedCsvExportConfig,
     ExportConfig,
+    JsonExportConfig,
     SummaryCsvExportConfig,
     YamlExportConfig,
 )
@@ -221,5 +222,6 @@ __all__ = [
     "DetailedCsvExportConfig",
     "CanvasExportConfig",
     "YamlExportConfig",
+    "JsonExportConfig",
     "ExportConfig",
 ]
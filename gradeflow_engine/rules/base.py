@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
+from functools import cache
 from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, Field
@@ -16,6 +20,8 @@ if TYPE_CHECKING:
 
 __all__ = [
     "create_grade_detail",
+    "get_text_normalizer",
+    "preprocess_text",
     "QuestionConstraint",
     "TextRuleConfig",
     "BaseRule",
@@ -92,6 +98,14 @@ class BaseSingleQuestionRule(BaseRule):
         return {self.question_id}
 
 
+@cache
+def _grade_detail_model() -> type[GradeDetail]:
+    """Resolve GradeDetail once; models imports the rules package, so it can't be imported here."""
+    from ..models import GradeDetail
+
+    return GradeDetail
+
+
 def create_grade_detail(
     question_id: str,
     student_answer: str | None,
@@ -103,9 +117,7 @@ def create_grade_detail(
     rule_applied: str | None = None,
 ) -> "GradeDetail":
     """Create a GradeDetail instance with the given question and scoring information."""
-    from ..models import GradeDetail
-
-    return GradeDetail(
+    return _grade_detail_model()(
         question_id=question_id,
         student_answer=student_answer,
         correct_answer=correct_answer,
@@ -117,10 +129,50 @@ def create_grade_detail(
     )
 
 
+# Per-pass processor caches, keyed by cache name; None outside grading_pass()
+_pass_caches: ContextVar[dict[str, dict] | None] = ContextVar("_pass_caches", default=None)
+
+
+@contextmanager
+def grading_pass() -> Iterator[None]:
+    """Scope processor caches to one grading pass; they are dropped on exit."""
+    token = _pass_caches.set({})
+    try:
+        yield
+    finally:
+        _pass_caches.reset(token)
+
+
+def get_pass_cache(name: str) -> dict | None:
+    """Return the named cache of the current grading pass, or None outside one."""
+    caches = _pass_caches.get()
+    if caches is None:
+        return None
+    return caches.setdefault(name, {})
+
+
+def _identity(text: str) -> str:
+    return text
+
+
+def _strip_lower(text: str) -> str:
+    return text.strip().lower()
+
+
+# Text normalizers specialized per (trim_whitespace, ignore_case) combination
+_TEXT_NORMALIZERS: dict[tuple[bool, bool], Callable[[str], str]] = {
+    (False, False): _identity,
+    (False, True): str.lower,
+    (True, False): str.strip,
+    (True, True): _strip_lower,
+}
+
+
+def get_text_normalizer(config: TextRuleConfig) -> Callable[[str], str]:
+    """Return the branch-free normalization function matching the config's flags."""
+    return _TEXT_NORMALIZERS[(config.trim_whitespace, config.ignore_case)]
+
+
 def preprocess_text(text: str, config: TextRuleConfig) -> str:
     """Preprocess text according to the provided TextRuleConfig (trim and case-fold)."""
-    if config.trim_whitespace:
-        text = text.strip()
-    if config.ignore_case:
-        text = text.lower()
-    return text
+    return get_text_normalizer(config)(text)
@@ -5,8 +5,12 @@ Exact Match Rule processor.
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
+from ..base import TextRuleConfig, create_grade_detail, get_text_normalizer
+
 if TYPE_CHECKING:
     from ...models import GradeDetail, Submission
     from .model import ExactMatchRule
@@ -14,24 +18,39 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _build_matcher(answer: str, trim_whitespace: bool, ignore_case: bool) -> Callable[[str], bool]:
+    """
+    Build and cache a matcher specialized for one expected answer and config.
+
+    The expected answer is normalized once and the normalizer is resolved up front,
+    so matching a submission does not re-check the config flags.
+    """
+    normalize = get_text_normalizer(
+        TextRuleConfig(trim_whitespace=trim_whitespace, ignore_case=ignore_case)
+    )
+    expected = normalize(answer)
+
+    def matches(student_answer: str) -> bool:
+        return normalize(student_answer) == expected
+
+    return matches
+
+
 def process_exact_match(rule: "ExactMatchRule", submission: "Submission") -> "GradeDetail | None":
     """
     Apply an exact match rule to grade a submission.
 
     Returns GradeDetail with max_points awarded and feedback.
     """
-    # Import here to avoid circular dependency
-    from ..base import create_grade_detail, preprocess_text
-
     logger.debug("Processing exact_match for question %s", rule.question_id)
 
     student_answer_raw = submission.answers.get(rule.question_id, "")
 
     # normalize both answers consistently
-    correct_normalized = preprocess_text(rule.answer, rule.config)
-    student_normalized = preprocess_text(student_answer_raw, rule.config)
+    matches = _build_matcher(rule.answer, rule.config.trim_whitespace, rule.config.ignore_case)
 
-    is_correct = student_normalized == correct_normalized
+    is_correct = matches(student_answer_raw)
     points_awarded = rule.max_points if is_correct else 0.0
 
     logger.debug(
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from ..base import create_grade_detail
+
 if TYPE_CHECKING:
     from ...models import GradeDetail, Submission
     from .model import NumericRangeRule
@@ -70,9 +72,6 @@ def process_numeric_range(
     Returns:
         GradeDetail with max_points awarded and feedback
     """
-    # Import here to avoid circular dependency
-    from ..base import create_grade_detail
-
     raw_answer = submission.answers.get(rule.question_id, "")
     student_answer = _normalize_answer(raw_answer)
 
@@ -4,10 +4,10 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Callable
+from functools import cache, lru_cache
 from typing import TYPE_CHECKING
 
-from rapidfuzz import fuzz
-from rapidfuzz.distance import JaroWinkler, Levenshtein
+from ..base import TextRuleConfig, create_grade_detail, get_pass_cache, get_text_normalizer
 
 if TYPE_CHECKING:
     from ...models import GradeDetail, Submission
@@ -32,32 +32,66 @@ def format_similarity_feedback(similarity: float, threshold: float) -> str:
     return f"✗ Insufficient similarity: {similarity:.0%} < {threshold:.0%}"
 
 
-def _select_similarity_func(algorithm: str) -> Callable[[str, str], float]:
+@cache
+def _similarity_funcs() -> dict[str, Callable[[str, str], float]]:
     """
-    Return a function that computes a normalized similarity in [0.0, 1.0]
-    for the given algorithm name.
+    Map each algorithm name to a function computing a normalized similarity
+    in [0.0, 1.0].
+
+    Built on first use so rapidfuzz is only imported once a similarity rule is
+    scored. Levenshtein and Jaro-Winkler map straight onto rapidfuzz's C scorers.
     """
-    alg = (algorithm or "levenshtein").lower()
+    from rapidfuzz import fuzz
+    from rapidfuzz.distance import JaroWinkler, Levenshtein
+
+    def token_sort_similarity(a: str, b: str) -> float:
+        # Rescale rapidfuzz's 0-100 ratio to [0.0, 1.0]
+        return fuzz.token_sort_ratio(a, b) / 100.0
+
+    return {
+        "levenshtein": Levenshtein.normalized_similarity,
+        "jaro_winkler": JaroWinkler.normalized_similarity,
+        "token_sort": token_sort_similarity,
+    }
+
+
+def _select_similarity_func(algorithm: str) -> Callable[[str, str], float]:
+    """Return the similarity function for an algorithm name, defaulting to Levenshtein."""
+    funcs = _similarity_funcs()
+    return funcs.get((algorithm or "levenshtein").lower(), funcs["levenshtein"])
 
-    if alg == "levenshtein":
-        return lambda a, b: Levenshtein.normalized_similarity(a, b)
-    if alg == "jaro_winkler":
-        return lambda a, b: JaroWinkler.normalized_similarity(a, b)
-    if alg == "token_sort":
-        return lambda a, b: fuzz.token_sort_ratio(a, b) / 100.0
 
-    # default fallback
-    return lambda a, b: Levenshtein.normalized_similarity(a, b)
+@lru_cache(maxsize=256)
+def _build_scorer(
+    reference: str, trim_whitespace: bool, ignore_case: bool, algorithm: str
+) -> Callable[[str], float]:
+    """
+    Build and cache a scorer specialized for one reference text and config.
+
+    The reference is normalized and the algorithm resolved once here rather
+    than for every submission; the returned function normalizes a raw student
+    answer and scores it. Only the reference is cached here; student answers
+    are memoized per grading pass in process_similarity.
+    """
+    normalize = get_text_normalizer(
+        TextRuleConfig(trim_whitespace=trim_whitespace, ignore_case=ignore_case)
+    )
+    reference_norm = normalize(reference)
+    similarity_func = _select_similarity_func(algorithm)
 
+    def score(student_answer: str) -> float:
+        student_answer_norm = normalize(student_answer)
+        # Identical strings (including both empty) are a perfect match for every
+        # algorithm, so skip the distance computation
+        if student_answer_norm == reference_norm:
+            return 1.0
+        try:
+            return float(similarity_func(student_answer_norm, reference_norm))
+        except Exception:
+            logger.exception("Error computing similarity using %s", algorithm)
+            return 0.0
 
-def _compute_similarity(a: str, b: str, algorithm: str) -> float:
-    """Compute similarity between two pre-normalized strings using algorithm."""
-    func = _select_similarity_func(algorithm)
-    try:
-        return float(func(a, b))
-    except Exception:
-        logger.exception("Error computing similarity using %s", algorithm)
-        return 0.0
+    return score
 
 
 def process_similarity(rule: "SimilarityRule", submission: "Submission") -> "GradeDetail | None":
@@ -73,9 +107,6 @@ def process_similarity(rule: "SimilarityRule", submission: "Submission") -> "Gra
     Returns:
         GradeDetail with max_points awarded and feedback
     """
-    # Import here to avoid circular dependency
-    from ..base import create_grade_detail, preprocess_text
-
     logger.debug(
         f"Processing similarity for question {rule.question_id} using {rule.config.algorithm}"
     )
@@ -83,15 +114,21 @@ def process_similarity(rule: "SimilarityRule", submission: "Submission") -> "Gra
     # Get raw student answer (keep existing get_student_answer usage / semantics)
     student_answer_raw = submission.answers.get(rule.question_id, "")
 
-    # Normalize both student answer and reference using rule.config
-    student_answer_norm = preprocess_text(student_answer_raw, rule.config)
-    reference_norm = preprocess_text(rule.reference, rule.config)
-
-    # If both are empty, treat as exact match
-    if not student_answer_norm and not reference_norm:
-        similarity = 1.0
+    score = _build_scorer(
+        rule.reference,
+        rule.config.trim_whitespace,
+        rule.config.ignore_case,
+        rule.config.algorithm,
+    )
+    # Many students give the same answer; score each distinct one once per pass
+    memo = get_pass_cache("similarity")
+    key = (score, student_answer_raw)
+    if memo is not None and key in memo:
+        similarity = memo[key]
     else:
-        similarity = _compute_similarity(student_answer_norm, reference_norm, rule.config.algorithm)
+        similarity = score(student_answer_raw)
+        if memo is not None:
+            memo[key] = similarity
 
     logger.debug("Computed similarity: %.2f (threshold: %.2f)", similarity, rule.threshold)
 
@@ -109,7 +109,9 @@ import platform
 import resource
 import signal
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
+from types import CodeType
 
 from RestrictedPython import (  # type: ignore[import-untyped]
     compile_restricted_exec,
@@ -238,6 +240,40 @@ def _validate_script(script: str) -> None:
         raise SandboxExecutionError(f"Script has syntax errors at line {e.lineno}: {e.msg}") from e
 
 
+@lru_cache(maxsize=256)
+def _compile_script(script: str) -> CodeType:
+    """
+    Validate and compile a grading script with RestrictedPython, caching the result.
+
+    A rubric applies the same script to every submission, so caching the code
+    object means each script is parsed and compiled once per process rather
+    than once per submission. Failures raise and are therefore not cached.
+
+    Args:
+        script: Python script to compile
+
+    Returns:
+        Compiled restricted code object
+
+    Raises:
+        ValueError: If script is invalid (empty, too large, too many lines)
+        SandboxExecutionError: If script has syntax or restricted compilation errors
+    """
+    _validate_script(script)
+
+    compile_result = compile_restricted_exec(script, filename="<grading_script>")
+
+    if compile_result.errors:
+        error_msg = "; ".join(compile_result.errors)
+        logger.error(f"Script compilation failed: {error_msg}")
+        raise SandboxExecutionError(f"Script compilation failed: {error_msg}")
+
+    code: CodeType | None = compile_result.code
+    if code is None:
+        raise SandboxExecutionError("Script compilation produced no code")
+    return code
+
+
 def _safe_iter(obj: object) -> object:
     """
     Safe iterator that allows iteration over basic Python types.
@@ -557,20 +593,10 @@ def execute_programmable_rule(
     if memory_mb <= 0:
         raise ValueError(f"memory_mb must be positive, got {memory_mb}")
 
-    # Validate script
-    _validate_script(script)
-
     logger.debug(f"Executing programmable rule for question {question_id}")
 
-    # Compile the script with RestrictedPython (before entering resource limits)
-    compile_result = compile_restricted_exec(script, filename="<grading_script>")
-
-    if compile_result.errors:
-        error_msg = "; ".join(compile_result.errors)
-        logger.error(f"Script compilation failed: {error_msg}")
-        raise SandboxExecutionError(f"Script compilation failed: {error_msg}")
-
-    byte_code = compile_result.code
+    # Validate and compile the script (cached; done before entering resource limits)
+    byte_code = _compile_script(script)
 
     # Set up restricted globals
     restricted_globals = _create_restricted_globals(student_answers, question_id, answer)
@@ -0,0 +1,24 @@
+"""
+Shared fixtures for rule tests.
+"""
+
+import pytest
+
+from gradeflow_engine.schema import (
+    AssessmentSchema,
+    ChoiceQuestionSchema,
+    NumericQuestionSchema,
+    TextQuestionSchema,
+)
+
+
+@pytest.fixture(scope="session")
+def assessment_schemas() -> dict[str, AssessmentSchema]:
+    """Single-question ("q1") assessment schemas keyed by question type."""
+    return {
+        "TEXT": AssessmentSchema(name="Test", questions={"q1": TextQuestionSchema()}),
+        "CHOICE": AssessmentSchema(
+            name="Test", questions={"q1": ChoiceQuestionSchema(options=["A", "B", "C"])}
+        ),
+        "NUMERIC": AssessmentSchema(name="Test", questions={"q1": NumericQuestionSchema()}),
+    }
@@ -103,6 +103,25 @@ class TestExactMatchRule:
         result = grade(rubric, [Submission(student_id="s1", answers={"q1": "\tAnswer\n"})])
         assert result.results[0].total_points == 10.0
 
+    def test_no_trim_case_sensitive(self):
+        """Test that disabling both normalizations requires a verbatim match."""
+        rule = ExactMatchRule(
+            question_id="q1",
+            answer=" Paris",
+            max_points=10.0,
+            config=TextRuleConfig(trim_whitespace=False, ignore_case=False),
+        )
+        rubric = Rubric(name="Test", rules=[rule])
+        result = grade(
+            rubric,
+            [
+                Submission(student_id="s1", answers={"q1": " Paris"}),
+                Submission(student_id="s2", answers={"q1": "Paris"}),
+                Submission(student_id="s3", answers={"q1": " paris"}),
+            ],
+        )
+        assert [r.total_points for r in result.results] == [10.0, 0.0, 0.0]
+
 
 class TestExactMatchSchemaValidation:
     """Test ExactMatchRule schema validation."""
@@ -2,151 +2,129 @@
 Tests for KeywordRule grading logic.
 """
 
+import pytest
+
 from gradeflow_engine import KeywordRule, Rubric, Submission, grade
-from gradeflow_engine.schema import (
-    AssessmentSchema,
-    ChoiceQuestionSchema,
-    NumericQuestionSchema,
-    TextQuestionSchema,
-)
+
+# case id -> (question id, student answer)
+_KEYWORD_CASES = {
+    "partial_both": ("q_partial", "Python programming is fun"),
+    "partial_one": ("q_partial", "Python is fun"),
+    "partial_two_of_three": ("q_partial_three", "An advanced professional approach"),
+    "all_present": ("q_all", "a b c d"),
+    "all_missing_one": ("q_all", "a b c"),
+    "any_present": ("q_any", "This mentions beta somewhere"),
+    "any_none": ("q_any", "No keywords here"),
+}
+
+
+@pytest.fixture(scope="class")
+def keyword_details():
+    """Grade every _KEYWORD_CASES answer in one grade() call.
+
+    All rules live in one rubric (one question per rule). Returns a mapping of
+    case id -> grade detail for that case's question.
+    """
+    rubric = Rubric(
+        name="Test",
+        rules=[
+            KeywordRule(
+                question_id="q_partial",
+                keywords=["python", "programming"],
+                mode="partial",
+                max_points=10.0,
+            ),
+            KeywordRule(
+                question_id="q_partial_three",
+                keywords=["advanced", "expert", "professional"],
+                mode="partial",
+                max_points=6.0,
+            ),
+            KeywordRule(
+                question_id="q_all",
+                keywords=["a", "b", "c", "d"],
+                mode="all",
+                max_points=12.0,
+            ),
+            KeywordRule(
+                question_id="q_any",
+                keywords=["alpha", "beta", "gamma"],
+                mode="any",
+                max_points=9.0,
+            ),
+        ],
+    )
+    result = grade(
+        rubric,
+        [
+            Submission(student_id=case_id, answers={question_id: answer})
+            for case_id, (question_id, answer) in _KEYWORD_CASES.items()
+        ],
+    )
+    return {
+        r.student_id: next(
+            d for d in r.grade_details if d.question_id == _KEYWORD_CASES[r.student_id][0]
+        )
+        for r in result.results
+    }
 
 
 class TestKeywordRule:
     """Test KeywordRule grading logic."""
 
-    def test_partial_mode_keyword_scoring(self):
+    def test_partial_mode_keyword_scoring(self, keyword_details):
         """Partial mode: points split evenly across keywords."""
-        rule = KeywordRule(
-            question_id="q1",
-            keywords=["python", "programming"],
-            mode="partial",
-            max_points=10.0,
-        )
-        rubric = Rubric(name="Test", rules=[rule])
-
         # Both keywords present -> full points
-        result = grade(
-            rubric, [Submission(student_id="s1", answers={"q1": "Python programming is fun"})]
-        )
-        assert result.results[0].total_points == 10.0
-        assert result.results[0].grade_details[0].is_correct
+        assert keyword_details["partial_both"].points_awarded == pytest.approx(10.0)
+        assert keyword_details["partial_both"].is_correct
 
         # One keyword missing -> half the points
-        result = grade(rubric, [Submission(student_id="s2", answers={"q1": "Python is fun"})])
-        assert result.results[0].total_points == 5.0
-        assert not result.results[0].grade_details[0].is_correct
+        assert keyword_details["partial_one"].points_awarded == pytest.approx(5.0)
+        assert not keyword_details["partial_one"].is_correct
 
-    def test_partial_mode_multiple_keywords(self):
+    def test_partial_mode_multiple_keywords(self, keyword_details):
         """Partial mode: multiple optional-like keywords awarded proportionally."""
-        rule = KeywordRule(
-            question_id="q1",
-            keywords=["advanced", "expert", "professional"],
-            mode="partial",
-            max_points=6.0,
-        )
-        rubric = Rubric(name="Test", rules=[rule])
-
-        result = grade(
-            rubric,
-            [Submission(student_id="s1", answers={"q1": "An advanced professional approach"})],
-        )
         # 2 out of 3 keywords found -> 2/3 of 6 = 4.0
-        assert result.results[0].total_points == 4.0
+        assert keyword_details["partial_two_of_three"].points_awarded == pytest.approx(4.0)
 
-    def test_all_mode_requires_all_keywords(self):
+    def test_all_mode_requires_all_keywords(self, keyword_details):
         """All mode: full points only when every keyword is present."""
-        rule = KeywordRule(
-            question_id="q1",
-            keywords=["a", "b", "c", "d"],
-            mode="all",
-            max_points=12.0,
-        )
-        rubric = Rubric(name="Test", rules=[rule])
-
         # All keywords present -> full points
-        result = grade(rubric, [Submission(student_id="s1", answers={"q1": "a b c d"})])
-        assert result.results[0].total_points == 12.0
+        assert keyword_details["all_present"].points_awarded == pytest.approx(12.0)
 
         # Missing one -> zero points
-        result = grade(rubric, [Submission(student_id="s2", answers={"q1": "a b c"})])
-        assert result.results[0].total_points == 0.0
-
-    def test_any_mode_awards_full_if_any_keyword_present(self):
-        rule = KeywordRule(
-            question_id="q1",
-            keywords=["alpha", "beta", "gamma"],
-            mode="any",
-            max_points=9.0,
-        )
-        rubric = Rubric(name="Test", rules=[rule])
+        assert keyword_details["all_missing_one"].points_awarded == pytest.approx(0.0)
 
+    def test_any_mode_awards_full_if_any_keyword_present(self, keyword_details):
         # One keyword present -> full points
-        result = grade(
-            rubric, [Submission(student_id="s1", answers={"q1": "This mentions beta somewhere"})]
-        )
-        assert result.results[0].total_points == 9.0
-        assert result.results[0].grade_details[0].is_correct
+        assert keyword_details["any_present"].points_awarded == pytest.approx(9.0)
+        assert keyword_details["any_present"].is_correct
 
         # No keywords present -> zero points
-        result = grade(rubric, [Submission(student_id="s2", answers={"q1": "No keywords here"})])
-        assert result.results[0].total_points == 0.0
-        assert not result.results[0].grade_details[0].is_correct
+        assert keyword_details["any_none"].points_awarded == pytest.approx(0.0)
+        assert not keyword_details["any_none"].is_correct
 
 
 class TestKeywordSchemaValidation:
     """Test KeywordRule schema validation."""
 
-    def test_validate_against_text_schema(self):
-        """Test that KeywordRule validates correctly against TEXT schema."""
-        rule = KeywordRule(
-            question_id="q1",
-            keywords=["python"],
-            max_points=5.0,
-        )
-        schema = AssessmentSchema(
-            name="Test",
-            questions={
-                "q1": TextQuestionSchema(),
-            },
-        )
-
-        errors = rule.validate_against_question_schema(schema.questions, "Rule 1")
-        assert errors == []
-
-    def test_validate_incompatible_choice_schema(self):
-        """Test that KeywordRule rejects CHOICE schema."""
+    @pytest.mark.parametrize(
+        "question_type,compatible",
+        [("TEXT", True), ("CHOICE", False), ("NUMERIC", False)],
+    )
+    def test_validate_against_schema(self, assessment_schemas, question_type, compatible):
+        """Test that KeywordRule accepts TEXT schemas and rejects other question types."""
         rule = KeywordRule(
             question_id="q1",
             keywords=["keyword"],
             max_points=5.0,
         )
-        schema = AssessmentSchema(
-            name="Test",
-            questions={
-                "q1": ChoiceQuestionSchema(options=["A", "B", "C"]),
-            },
-        )
-
-        errors = rule.validate_against_question_schema(schema.questions, "Rule 1")
-        assert len(errors) == 1
-        assert "only compatible with" in errors[0]
-        assert "CHOICE" in errors[0]
-
-    def test_validate_incompatible_numeric_schema(self):
-        """Test that KeywordRule rejects NUMERIC schema."""
-        rule = KeywordRule(
-            question_id="q1",
-            keywords=["keyword"],
-            max_points=5.0,
-        )
-        schema = AssessmentSchema(
-            name="Test",
-            questions={
-                "q1": NumericQuestionSchema(),
-            },
-        )
+        schema = assessment_schemas[question_type]
 
         errors = rule.validate_against_question_schema(schema.questions, "Rule 1")
-        assert len(errors) == 1
-        assert "only compatible with" in errors[0]
-        assert "NUMERIC" in errors[0]
+        if compatible:
+            assert errors == []
+        else:
+            assert len(errors) == 1
+            assert "only compatible with" in errors[0]
+            assert question_type in errors[0]
@@ -2,197 +2,90 @@
 Tests for LengthRule grading logic.
 """
 
-from gradeflow_engine import LengthRule, Rubric, Submission, grade
-from gradeflow_engine.schema import (
-    AssessmentSchema,
-    ChoiceQuestionSchema,
-    NumericQuestionSchema,
-    TextQuestionSchema,
-)
-
-
-class TestLengthRule:
-    """Test LengthRule grading logic."""
-
-    def test_word_count_exact(self):
-        """Test exact word count."""
-        rule = LengthRule(
-            question_id="q1",
-            min_length=5,
-            max_length=5,
-            mode="words",
-            max_points=10.0,
-        )
-        rubric = Rubric(name="Test", rules=[rule])
-        result = grade(
-            rubric, [Submission(student_id="s1", answers={"q1": "This is exactly five words"})]
-        )
-        assert result.results[0].total_points == 10.0
-
-        result = grade(rubric, [Submission(student_id="s2", answers={"q1": "Too short"})])
-        assert result.results[0].total_points == 0.0
-
-    def test_word_count_range(self):
-        """Test word count range."""
-        rule = LengthRule(
-            question_id="q1",
-            min_length=3,
-            max_length=7,
-            mode="words",
-            max_points=10.0,
-        )
-        rubric = Rubric(name="Test", rules=[rule])
-        result = grade(
-            rubric, [Submission(student_id="s1", answers={"q1": "This has five words exactly"})]
-        )
-        assert result.results[0].total_points == 10.0
-
-    def test_character_count(self):
-        """Test character count."""
-        rule = LengthRule(
-            question_id="q1",
-            min_length=10,
-            max_length=20,
-            mode="characters",
-            max_points=10.0,
-        )
-        rubric = Rubric(name="Test", rules=[rule])
-        result = grade(
-            rubric, [Submission(student_id="s1", answers={"q1": "This is 15 char"})]
-        )  # within 10..20 characters
-        assert result.results[0].total_points == 10.0
-
-    def test_sentence_count(self):
-        """Test with a word-based limit for multi-sentence answer."""
-        rule = LengthRule(
-            question_id="q1",
-            min_length=2,
-            max_length=10,
-            mode="words",
-            max_points=10.0,
-        )
-        rubric = Rubric(name="Test", rules=[rule])
-        result = grade(
-            rubric,
-            [Submission(student_id="s1", answers={"q1": "First sentence. Second sentence."})],
-        )
-        assert result.results[0].total_points == 10.0
-
-    def test_empty_answer(self):
-        """Test with empty answer."""
-        rule = LengthRule(
-            question_id="q1",
-            min_length=5,
-            max_length=10,
-            mode="words",
-            max_points=10.0,
-        )
-        rubric = Rubric(name="Test", rules=[rule])
-        result = grade(rubric, [Submission(student_id="s1", answers={"q1": ""})])
-        assert result.results[0].total_points == 0.0
-
-    def test_whitespace_only(self):
-        """Test with whitespace-only answer."""
-        rule = LengthRule(
-            question_id="q1",
-            min_length=1,
-            max_length=10,
-            mode="words",
-            max_points=10.0,
-        )
-        rubric = Rubric(name="Test", rules=[rule])
-        result = grade(rubric, [Submission(student_id="s1", answers={"q1": "   \n\t  "})])
-        assert result.results[0].total_points == 0.0
+import re
 
-    def test_only_char_limit(self):
-        """Test with only character limit specified."""
-        rule = LengthRule(
-            question_id="q1",
-            min_length=5,
-            max_length=15,
-            mode="characters",
-            max_points=10.0,
-        )
-        rubric = Rubric(name="Test", rules=[rule])
-        result = grade(rubric, [Submission(student_id="s1", answers={"q1": "Hello!"})])
-        assert result.results[0].total_points == 10.0
+import pytest
 
-    def test_too_long(self):
-        """Test answer that's too long (word-based)."""
-        rule = LengthRule(
-            question_id="q1",
-            min_length=1,
-            max_length=3,
-            mode="words",
-            max_points=10.0,
-        )
-        rubric = Rubric(name="Test", rules=[rule])
-        result = grade(
-            rubric, [Submission(student_id="s1", answers={"q1": "This is way too long"})]
-        )
-        assert result.results[0].total_points == 0.0
-
-    def test_character_limits_min(self):
-        """Test minimum character limit and feedback wording."""
-        rule = LengthRule(question_id="q1", min_length=20, mode="characters", max_points=10.0)
+from gradeflow_engine import LengthRule, Rubric, Submission, grade
 
-        rubric = Rubric(name="Test", rules=[rule])
+# Student answers shared across tests
+_FIVE_WORDS = "This is exactly five words"
+_FIVE_WORDS_REORDERED = "This has five words exactly"
+_TWO_WORDS = "Too short"
+_FIFTEEN_CHARS = "This is 15 char"
+_TWO_SENTENCES = "First sentence. Second sentence."
+_WHITESPACE_ONLY = "   \n\t  "
+_TOO_LONG = "This is way too long"
+_SHORT = "Short"
+_ENOUGH_CHARS = "This has enough characters"
+
+# Feedback must name the violation and the measuring mode (in any order)
+_TOO_SHORT_CHARS = re.compile(r"^(?=.*Too short)(?=.*characters)", re.S)
+_TOO_LONG_CHARS = re.compile(r"^(?=.*Too long)(?=.*characters)", re.S)
+
+
+def _limits(mode, min_length=None, max_length=None):
+    """LengthRule kwargs for a mode, omitting unset limits."""
+    limits = {"min_length": min_length, "max_length": max_length}
+    return {"mode": mode, **{k: v for k, v in limits.items() if v is not None}}
+
+
+def _words(min_length=None, max_length=None):
+    return _limits("words", min_length, max_length)
+
+
+def _chars(min_length=None, max_length=None):
+    return _limits("characters", min_length, max_length)
+
+
+# (rule kwargs, student answer, expected points, feedback pattern or None)
+LENGTH_CASES = [
+    pytest.param(_words(5, 5), _FIVE_WORDS, 10.0, None, id="word-count-exact"),
+    pytest.param(_words(5, 5), _TWO_WORDS, 0.0, None, id="word-count-exact-miss"),
+    pytest.param(_words(3, 7), _FIVE_WORDS_REORDERED, 10.0, None, id="word-count-range"),
+    pytest.param(_chars(10, 20), _FIFTEEN_CHARS, 10.0, None, id="character-count"),
+    # Word-based limit on a multi-sentence answer
+    pytest.param(_words(2, 10), _TWO_SENTENCES, 10.0, None, id="sentence-count"),
+    pytest.param(_words(5, 10), "", 0.0, None, id="empty-answer"),
+    pytest.param(_words(1, 10), _WHITESPACE_ONLY, 0.0, None, id="whitespace-only"),
+    pytest.param(_chars(5, 15), "Hello!", 10.0, None, id="only-char-limit"),
+    pytest.param(_words(1, 3), _TOO_LONG, 0.0, None, id="too-long-words"),
+    pytest.param(_chars(min_length=20), _SHORT, 0.0, _TOO_SHORT_CHARS, id="min-chars-miss"),
+    pytest.param(_chars(min_length=20), _ENOUGH_CHARS, 10.0, None, id="min-chars-met"),
+    pytest.param(_chars(max_length=10), _TOO_LONG, 0.0, _TOO_LONG_CHARS, id="max-chars-miss"),
+    pytest.param(_chars(max_length=10), _SHORT, 10.0, None, id="max-chars-met"),
+    # Violations zero the score rather than deducting per violation
+    pytest.param(_words(5, 10), "Hi", 0.0, None, id="violation-yields-zero"),
+]
 
-        # Too few characters
-        result = grade(rubric, [Submission(student_id="s1", answers={"q1": "Short"})])
-        assert result.results[0].total_points == 0.0
-        fb = result.results[0].grade_details[0].feedback or ""
-        assert "Too short" in fb
-        assert "characters" in fb  # expected string includes mode
 
-        # Enough characters
-        result = grade(
-            rubric, [Submission(student_id="s1", answers={"q1": "This has enough characters"})]
-        )
-        assert result.results[0].total_points == 10.0
-
-    def test_character_limits_max(self):
-        """Test maximum character limit and feedback wording."""
-        rule = LengthRule(question_id="q1", max_length=10, mode="characters", max_points=10.0)
-
-        rubric = Rubric(name="Test", rules=[rule])
+class TestLengthRule:
+    """Test LengthRule grading logic."""
 
-        # Too many characters
+    @pytest.mark.parametrize("rule_kwargs,answer,expected,feedback", LENGTH_CASES)
+    def test_grading(self, rule_kwargs, answer, expected, feedback):
+        """Test that each length limit awards the expected points and feedback."""
+        rule = LengthRule(question_id="q1", max_points=10.0, **rule_kwargs)
         result = grade(
-            rubric, [Submission(student_id="s1", answers={"q1": "This is way too long"})]
-        )
-        assert result.results[0].total_points == 0.0
-        fb = result.results[0].grade_details[0].feedback or ""
-        assert "Too long" in fb
-        assert "characters" in fb
-
-        # Within limit
-        result = grade(rubric, [Submission(student_id="s1", answers={"q1": "Short"})])
-        assert result.results[0].total_points == 10.0
-
-    def test_multiple_violations_yield_zero(self):
-        """Multiple violations result in zero points (no per-violation deduction)."""
-        # Use a word-based rule with a range that will be violated
-        rule = LengthRule(
-            question_id="q1",
-            min_length=5,
-            max_length=10,
-            mode="words",
-            max_points=10.0,
+            Rubric(name="Test", rules=[rule]),
+            [Submission(student_id="s1", answers={"q1": answer})],
         )
 
-        rubric = Rubric(name="Test", rules=[rule])
-
-        # Answer with too few words (and thus violates)
-        result = grade(rubric, [Submission(student_id="s1", answers={"q1": "Hi"})])
-        assert result.results[0].total_points == 0.0
+        detail = result.results[0].grade_details[0]
+        assert detail.points_awarded == pytest.approx(expected)
+        if feedback is not None:
+            assert feedback.search(detail.feedback or "")
 
 
 class TestLengthSchemaValidation:
     """Test LengthRule schema validation."""
 
-    def test_validate_against_text_schema(self):
-        """Test that LengthRule validates correctly against TEXT schema."""
+    @pytest.mark.parametrize(
+        "question_type,compatible",
+        [("TEXT", True), ("CHOICE", False), ("NUMERIC", False)],
+    )
+    def test_validate_against_schema(self, assessment_schemas, question_type, compatible):
+        """Test that LengthRule accepts TEXT schemas and rejects other question types."""
         rule = LengthRule(
             question_id="q1",
             min_length=10,
@@ -200,54 +93,12 @@ class TestLengthSchemaValidation:
             mode="words",
             max_points=10.0,
         )
-        schema = AssessmentSchema(
-            name="Test",
-            questions={
-                "q1": TextQuestionSchema(),
-            },
-        )
-
-        errors = rule.validate_against_question_schema(schema.questions, "Rule 1")
-        assert errors == []
-
-    def test_validate_incompatible_choice_schema(self):
-        """Test that LengthRule rejects CHOICE schema."""
-        rule = LengthRule(
-            question_id="q1",
-            min_length=1,
-            max_length=10,
-            mode="characters",
-            max_points=10.0,
-        )
-        schema = AssessmentSchema(
-            name="Test",
-            questions={
-                "q1": ChoiceQuestionSchema(options=["A", "B", "C"]),
-            },
-        )
-
-        errors = rule.validate_against_question_schema(schema.questions, "Rule 1")
-        assert len(errors) == 1
-        assert "only compatible with" in errors[0]
-        assert "CHOICE" in errors[0]
-
-    def test_validate_incompatible_numeric_schema(self):
-        """Test that LengthRule rejects NUMERIC schema."""
-        rule = LengthRule(
-            question_id="q1",
-            min_length=5,
-            max_length=10,
-            mode="words",
-            max_points=10.0,
-        )
-        schema = AssessmentSchema(
-            name="Test",
-            questions={
-                "q1": NumericQuestionSchema(),
-            },
-        )
+        schema = assessment_schemas[question_type]
 
         errors = rule.validate_against_question_schema(schema.questions, "Rule 1")
-        assert len(errors) == 1
-        assert "only compatible with" in errors[0]
-        assert "NUMERIC" in errors[0]
+        if compatible:
+            assert errors == []
+        else:
+            assert len(errors) == 1
+            assert "only compatible with" in errors[0]
+            assert question_type in errors[0]
@@ -2,206 +2,155 @@
 Tests for MultipleChoiceRule grading logic.
 """
 
+import pytest
+
 from gradeflow_engine import MultipleChoiceRule, Rubric, Submission, grade
 
 # Add explicit config model import for proper config objects
 from gradeflow_engine.rules.multiple_choice.model import MultipleChoiceRuleConfig
-from gradeflow_engine.schema import (
-    AssessmentSchema,
-    ChoiceQuestionSchema,
-    NumericQuestionSchema,
-    TextQuestionSchema,
-)
+from gradeflow_engine.schema import AssessmentSchema, ChoiceQuestionSchema
+
+_SINGLE_B = {"question_id": "q1", "answers": ["b"], "max_points": 10.0, "mode": "all"}
+_ALL_AC = {"question_id": "q1", "answers": ["a", "c"], "max_points": 10.0, "mode": "all"}
+_PARTIAL_ABC = {
+    "question_id": "q1",
+    "answers": ["a", "b", "c"],
+    "max_points": 12.0,
+    "mode": "partial",
+}
+_CASE_SENSITIVE_A = {
+    "question_id": "q1",
+    "answers": ["a"],
+    "max_points": 10.0,
+    "mode": "all",
+    "config": MultipleChoiceRuleConfig(ignore_case=False),
+}
+
+
+# (rule kwargs, student answer, expected points)
+MC_CASES = [
+    # All-or-nothing with a single correct answer
+    # (lowercase answers to match current validation behavior)
+    pytest.param(_SINGLE_B, "B", 10.0, id="single-correct"),
+    pytest.param(_SINGLE_B, "A", 0.0, id="single-wrong"),
+    # All-or-nothing with multiple correct answers
+    pytest.param(_ALL_AC, "A,C", 10.0, id="multiple-all-correct"),
+    pytest.param(_ALL_AC, "A", 0.0, id="multiple-partial"),
+    # Partial credit scoring
+    pytest.param(_PARTIAL_ABC, "A,B,C", 12.0, id="partial-3-of-3"),
+    pytest.param(_PARTIAL_ABC, "A,B", 8.0, id="partial-2-of-3"),
+    pytest.param(_PARTIAL_ABC, "C", 4.0, id="partial-1-of-3"),
+    # Custom delimiter for answers
+    pytest.param(
+        {**_ALL_AC, "config": MultipleChoiceRuleConfig(delimiter=";")},
+        "A;C",
+        10.0,
+        id="custom-delimiter",
+    ),
+    # Whitespace trimming
+    pytest.param(
+        {
+            "question_id": "q1",
+            "answers": ["a", "b"],
+            "max_points": 10.0,
+            "mode": "all",
+            "config": MultipleChoiceRuleConfig(trim_whitespace=True),
+        },
+        " A , B ",
+        10.0,
+        id="whitespace-trimmed",
+    ),
+    # Case-sensitive matching
+    pytest.param(_CASE_SENSITIVE_A, "A", 0.0, id="case-sensitive-mismatch"),
+    pytest.param(_CASE_SENSITIVE_A, "a", 10.0, id="case-sensitive-match"),
+]
 
 
 class TestMultipleChoiceRule:
     """Test MultipleChoiceRule grading logic."""
 
-    def test_all_or_nothing_single_correct(self):
-        """Test all-or-nothing with single correct answer."""
-        rule = MultipleChoiceRule(
-            question_id="q1",
-            answers=["b"],  # use lowercase to match current validation behavior
-            max_points=10.0,
-            mode="all",
-        )
-        rubric = Rubric(name="Test", rules=[rule])
-        result = grade(rubric, [Submission(student_id="s1", answers={"q1": "B"})])
-        assert result.results[0].total_points == 10.0
-
-        result = grade(rubric, [Submission(student_id="s2", answers={"q1": "A"})])
-        assert result.results[0].total_points == 0.0
-
-    def test_all_or_nothing_multiple_correct(self):
-        """Test all-or-nothing with multiple correct answers."""
-        rule = MultipleChoiceRule(
-            question_id="q1",
-            answers=["a", "c"],
-            max_points=10.0,
-            mode="all",
-        )
-        rubric = Rubric(name="Test", rules=[rule])
-        # All correct
-        result = grade(rubric, [Submission(student_id="s1", answers={"q1": "A,C"})])
-        assert result.results[0].total_points == 10.0
-
-        # Partial
-        result = grade(rubric, [Submission(student_id="s2", answers={"q1": "A"})])
-        assert result.results[0].total_points == 0.0
-
-    def test_partial_scoring(self):
-        """Test partial credit scoring."""
-        rule = MultipleChoiceRule(
-            question_id="q1",
-            answers=["a", "b", "c"],
-            max_points=12.0,
-            mode="partial",
+    @pytest.mark.parametrize("rule_kwargs,answer,expected", MC_CASES)
+    def test_grading(self, rule_kwargs, answer, expected):
+        """Test that each rule configuration awards the expected points."""
+        rubric = Rubric(name="Test", rules=[MultipleChoiceRule(**rule_kwargs)])
+        result = grade(
+            rubric,
+            [Submission(student_id="s1", answers={"q1": answer})],
         )
-        rubric = Rubric(name="Test", rules=[rule])
-        # All correct
-        result = grade(rubric, [Submission(student_id="s1", answers={"q1": "A,B,C"})])
-        assert result.results[0].total_points == 12.0
+        assert result.results[0].total_points == pytest.approx(expected)
 
-        # 2 out of 3
-        result = grade(rubric, [Submission(student_id="s2", answers={"q1": "A,B"})])
-        assert result.results[0].total_points == 8.0
 
-        # 1 out of 3
-        result = grade(rubric, [Submission(student_id="s3", answers={"q1": "C"})])
-        assert result.results[0].total_points == 4.0
-
-    def test_custom_delimiter(self):
-        """Test custom delimiter for answers."""
-        rule = MultipleChoiceRule(
-            question_id="q1",
-            answers=["a", "c"],
-            max_points=10.0,
-            mode="all",
-            config=MultipleChoiceRuleConfig(delimiter=";"),
-        )
-        rubric = Rubric(name="Test", rules=[rule])
-        result = grade(rubric, [Submission(student_id="s1", answers={"q1": "A;C"})])
-        assert result.results[0].total_points == 10.0
-
-    def test_whitespace_handling(self):
-        """Test whitespace trimming."""
-        rule = MultipleChoiceRule(
-            question_id="q1",
-            answers=["a", "b"],
-            max_points=10.0,
-            mode="all",
-            config=MultipleChoiceRuleConfig(trim_whitespace=True),
-        )
-        rubric = Rubric(name="Test", rules=[rule])
-        result = grade(rubric, [Submission(student_id="s1", answers={"q1": " A , B "})])
-        assert result.results[0].total_points == 10.0
-
-    def test_case_sensitivity(self):
-        """Test case-sensitive matching."""
-        rule = MultipleChoiceRule(
-            question_id="q1",
-            answers=["a"],
-            max_points=10.0,
-            mode="all",
-            config=MultipleChoiceRuleConfig(ignore_case=False),
-        )
-        rubric = Rubric(name="Test", rules=[rule])
-        result = grade(rubric, [Submission(student_id="s1", answers={"q1": "A"})])
-        assert result.results[0].total_points == 0.0
-
-        result = grade(rubric, [Submission(student_id="s2", answers={"q1": "a"})])
-        assert result.results[0].total_points == 10.0
+@pytest.fixture(scope="module")
+def choice_abcd_schema():
+    """Assessment schema with a single four-option CHOICE question."""
+    return AssessmentSchema(
+        name="Test",
+        questions={"q1": ChoiceQuestionSchema(options=["A", "B", "C", "D"])},
+    )
 
 
 class TestMultipleChoiceSchemaValidation:
     """Test MultipleChoiceRule schema validation."""
 
-    def test_validate_against_choice_schema(self):
+    def test_validate_against_choice_schema(self, choice_abcd_schema):
         """Test that MultipleChoiceRule validates correctly against CHOICE schema."""
         rule = MultipleChoiceRule(
             question_id="q1",
             answers=["a", "b"],  # lowercase to align with current validation implementation
             max_points=10.0,
         )
-        schema = AssessmentSchema(
-            name="Test",
-            questions={
-                "q1": ChoiceQuestionSchema(options=["A", "B", "C", "D"]),
-            },
-        )
 
-        errors = rule.validate_against_question_schema(schema.questions, "Rule 1")
+        errors = rule.validate_against_question_schema(choice_abcd_schema.questions, "Rule 1")
         assert errors == []
 
-    def test_validate_incompatible_numeric_schema(self):
+    def test_validate_incompatible_numeric_schema(self, assessment_schemas):
         """Test that MultipleChoiceRule rejects NUMERIC schema."""
         rule = MultipleChoiceRule(
             question_id="q1",
             answers=["a"],
             max_points=10.0,
         )
-        schema = AssessmentSchema(
-            name="Test",
-            questions={
-                "q1": NumericQuestionSchema(),
-            },
-        )
+        schema = assessment_schemas["NUMERIC"]
 
         errors = rule.validate_against_question_schema(schema.questions, "Rule 1")
         assert len(errors) == 1
         assert "only compatible with" in errors[0]
         assert "CHOICE" in errors[0]
 
-    def test_validate_incompatible_text_schema(self):
+    def test_validate_incompatible_text_schema(self, assessment_schemas):
         """Test that MultipleChoiceRule rejects TEXT schema."""
         rule = MultipleChoiceRule(
             question_id="q1",
             answers=["answer"],
             max_points=10.0,
         )
-        schema = AssessmentSchema(
-            name="Test",
-            questions={
-                "q1": TextQuestionSchema(),
-            },
-        )
+        schema = assessment_schemas["TEXT"]
 
         errors = rule.validate_against_question_schema(schema.questions, "Rule 1")
         assert len(errors) == 1
         assert "only compatible with" in errors[0]
 
-    def test_validate_answer_not_in_options(self):
+    def test_validate_answer_not_in_options(self, choice_abcd_schema):
         """Test that MultipleChoiceRule validates answers are in schema options."""
         rule = MultipleChoiceRule(
             question_id="q1",
             answers=["a", "e"],  # 'e' not in options; lowercase to match validation
             max_points=10.0,
         )
-        schema = AssessmentSchema(
-            name="Test",
-            questions={
-                "q1": ChoiceQuestionSchema(options=["A", "B", "C", "D"]),
-            },
-        )
 
-        errors = rule.validate_against_question_schema(schema.questions, "Rule 1")
+        errors = rule.validate_against_question_schema(choice_abcd_schema.questions, "Rule 1")
         assert len(errors) == 1
         assert "not in schema options" in errors[0]
         assert "e" in errors[0]
 
-    def test_validate_multiple_answers_not_in_options(self):
+    def test_validate_multiple_answers_not_in_options(self, assessment_schemas):
         """Test validation with multiple invalid answers."""
         rule = MultipleChoiceRule(
             question_id="q1",
             answers=["e", "f"],  # Both not in options
             max_points=10.0,
         )
-        schema = AssessmentSchema(
-            name="Test",
-            questions={
-                "q1": ChoiceQuestionSchema(options=["A", "B", "C"]),
-            },
-        )
+        schema = assessment_schemas["CHOICE"]
 
         errors = rule.validate_against_question_schema(schema.questions, "Rule 1")
         assert len(errors) >= 1
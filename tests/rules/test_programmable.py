@@ -2,12 +2,11 @@
 Tests for ProgrammableRule grading logic.
 """
 
+import pytest
+
 from gradeflow_engine import ProgrammableRule, Rubric, Submission, grade
-from gradeflow_engine.schema import (
-    ChoiceQuestionSchema,
-    NumericQuestionSchema,
-    TextQuestionSchema,
-)
+
+_SIXTY_WORDS = " ".join(["word"] * 60)
 
 
 class TestProgrammableRule:
@@ -24,11 +23,14 @@ feedback = 'Contains Python' if points_awarded > 0 else 'Missing Python'
             max_points=10.0,
         )
         rubric = Rubric(name="Test", rules=[rule])
-        result = grade(rubric, [Submission(student_id="s1", answers={"q1": "I love Python"})])
-        assert result.results[0].total_points == 10.0
-
-        result = grade(rubric, [Submission(student_id="s2", answers={"q1": "I love Java"})])
-        assert result.results[0].total_points == 0.0
+        result = grade(
+            rubric,
+            [
+                Submission(student_id="s1", answers={"q1": "I love Python"}),
+                Submission(student_id="s2", answers={"q1": "I love Java"}),
+            ],
+        )
+        assert [r.total_points for r in result.results] == [10.0, 0.0]
 
     def test_complex_script(self):
         """Test complex grading logic."""
@@ -51,45 +53,24 @@ else:
             max_points=10.0,
         )
         rubric = Rubric(name="Test", rules=[rule])
+
         # Long answer
-        result = grade(
-            rubric, [Submission(student_id="s1", answers={"q1": " ".join(["word"] * 60)})]
-        )
+        result = grade(rubric, [Submission(student_id="s1", answers={"q1": _SIXTY_WORDS})])
         assert result.results[0].total_points == 10.0
 
 
 class TestProgrammableSchemaValidation:
     """Test ProgrammableRule schema validation."""
 
-    def test_validate_against_text_schema(self):
-        """Test that ProgrammableRule validates correctly against TEXT schema."""
+    @pytest.mark.parametrize("question_type", ["TEXT", "CHOICE", "NUMERIC"])
+    def test_validate_against_schema(self, assessment_schemas, question_type):
+        """Test that ProgrammableRule validates correctly against every question type."""
         rule = ProgrammableRule(
             question_id="q1",
             code="points_awarded = 10.0",
             max_points=10.0,
         )
-        schema = TextQuestionSchema()
-        errors = rule.validate_against_question_schema({"q1": schema}, "Rule 1")
-        assert errors == []
-
-    def test_validate_against_choice_schema(self):
-        """Test that ProgrammableRule validates correctly against CHOICE schema."""
-        rule = ProgrammableRule(
-            question_id="q1",
-            code="points_awarded = 10.0 if answer == 'A' else 0.0",
-            max_points=10.0,
-        )
-        schema = ChoiceQuestionSchema(options=["A", "B", "C"])
-        errors = rule.validate_against_question_schema({"q1": schema}, "Rule 1")
-        assert errors == []
+        schema = assessment_schemas[question_type]
 
-    def test_validate_against_numeric_schema(self):
-        """Test that ProgrammableRule validates correctly against NUMERIC schema."""
-        rule = ProgrammableRule(
-            question_id="q1",
-            code="points_awarded = 10.0 if float(answer) > 50 else 0.0",
-            max_points=10.0,
-        )
-        schema = NumericQuestionSchema()
-        errors = rule.validate_against_question_schema({"q1": schema}, "Rule 1")
+        errors = rule.validate_against_question_schema(schema.questions, "Rule 1")
         assert errors == []
@@ -6,29 +6,25 @@ import pytest
 
 from gradeflow_engine import RegexRule, Rubric, Submission, grade
 from gradeflow_engine.rules.regex.model import RegexRuleConfig
-from gradeflow_engine.schema import (
-    AssessmentSchema,
-    ChoiceQuestionSchema,
-    NumericQuestionSchema,
-    TextQuestionSchema,
-)
+
+
+@pytest.fixture(scope="class")
+def digits_rubric():
+    """Rubric matching any run of digits, worth 5 points."""
+    return Rubric(name="Test", rules=[RegexRule(question_id="q1", pattern=r"\d+", max_points=5.0)])
 
 
 class TestRegexRule:
     """Test RegexRule grading logic."""
 
-    def test_pattern_matches(self):
+    def test_pattern_matches(self, digits_rubric):
         """A single pattern that matches should award max_points."""
-        rule = RegexRule(question_id="q1", pattern=r"\d+", max_points=5.0)
-        rubric = Rubric(name="Test", rules=[rule])
-        result = grade(rubric, [Submission(student_id="s1", answers={"q1": "ABC 123"})])
+        result = grade(digits_rubric, [Submission(student_id="s1", answers={"q1": "ABC 123"})])
         assert result.results[0].total_points == 5.0
 
-    def test_pattern_does_not_match(self):
+    def test_pattern_does_not_match(self, digits_rubric):
         """A pattern that does not match should award zero points."""
-        rule = RegexRule(question_id="q1", pattern=r"[A-Z]", max_points=5.0)
-        rubric = Rubric(name="Test", rules=[rule])
-        result = grade(rubric, [Submission(student_id="s1", answers={"q1": "123"})])
+        result = grade(digits_rubric, [Submission(student_id="s1", answers={"q1": "ABC"})])
         assert result.results[0].total_points == 0.0
 
     def test_case_insensitive(self):
@@ -52,10 +48,7 @@ class TestRegexRule:
             config=RegexRuleConfig(multi_line=True, dotall=True),
         )
         rubric = Rubric(name="Test", rules=[rule])
-        result = grade(
-            rubric,
-            [Submission(student_id="s1", answers={"q1": "Start\nmiddle\nEnd"})],
-        )
+        result = grade(rubric, [Submission(student_id="s1", answers={"q1": "Start\nmiddle\nEnd"})])
         assert result.results[0].total_points == 10.0
 
     def test_invalid_pattern_raises_on_model_creation(self):
@@ -67,42 +60,19 @@ class TestRegexRule:
 class TestRegexSchemaValidation:
     """Test RegexRule schema validation."""
 
-    def test_validate_against_text_schema(self):
-        """RegexRule validates correctly against TEXT schema."""
+    @pytest.mark.parametrize(
+        "question_type,compatible",
+        [("TEXT", True), ("CHOICE", False), ("NUMERIC", False)],
+    )
+    def test_validate_against_schema(self, assessment_schemas, question_type, compatible):
+        """RegexRule accepts TEXT schemas and rejects other question types."""
         rule = RegexRule(question_id="q1", pattern=r"\d+", max_points=10.0)
-        schema = AssessmentSchema(
-            name="Test",
-            questions={
-                "q1": TextQuestionSchema(),
-            },
-        )
-        errors = rule.validate_against_question_schema(schema.questions, "Rule 1")
-        assert errors == []
-
-    def test_validate_incompatible_choice_schema(self):
-        """RegexRule rejects CHOICE schema."""
-        rule = RegexRule(question_id="q1", pattern=r"[A-Z]", max_points=10.0)
-        schema = AssessmentSchema(
-            name="Test",
-            questions={
-                "q1": ChoiceQuestionSchema(options=["A", "B", "C"]),
-            },
-        )
-        errors = rule.validate_against_question_schema(schema.questions, "Rule 1")
-        assert len(errors) == 1
-        assert "only compatible with" in errors[0]
-        assert "CHOICE" in errors[0]
+        schema = assessment_schemas[question_type]
 
-    def test_validate_incompatible_numeric_schema(self):
-        """RegexRule rejects NUMERIC schema."""
-        rule = RegexRule(question_id="q1", pattern=r"\d+", max_points=10.0)
-        schema = AssessmentSchema(
-            name="Test",
-            questions={
-                "q1": NumericQuestionSchema(),
-            },
-        )
         errors = rule.validate_against_question_schema(schema.questions, "Rule 1")
-        assert len(errors) == 1
-        assert "only compatible with" in errors[0]
-        assert "NUMERIC" in errors[0]
+        if compatible:
+            assert errors == []
+        else:
+            assert len(errors) == 1
+            assert "only compatible with" in errors[0]
+            assert question_type in errors[0]
@@ -3,6 +3,7 @@ Tests for SimilarityRule grading logic.
 """
 
 from gradeflow_engine import Rubric, SimilarityRule, Submission, grade
+from gradeflow_engine.rules.similarity import processor
 from gradeflow_engine.rules.similarity.model import SimilarityRuleConfig
 from gradeflow_engine.schema import (
     AssessmentSchema,
@@ -82,6 +83,72 @@ class TestSimilarityRule:
         result = grade(rubric, [Submission(student_id="s1", answers={"q1": "python programming"})])
         assert result.results[0].total_points == 10.0
 
+    def test_reference_is_normalized(self):
+        """Test that the reference gets the same trimming and case folding as answers."""
+        rule = SimilarityRule(
+            question_id="q1",
+            reference="  Python Programming ",
+            config=SimilarityRuleConfig(trim_whitespace=True, ignore_case=True),
+            threshold=1.0,
+            max_points=10.0,
+        )
+        rubric = Rubric(name="Test", rules=[rule])
+        result = grade(rubric, [Submission(student_id="s1", answers={"q1": "python programming"})])
+        assert result.results[0].total_points == 10.0
+
+    def test_empty_answer_and_reference(self):
+        """Test that an empty answer matches an empty reference."""
+        rule = SimilarityRule(
+            question_id="q1",
+            reference="   ",
+            config=SimilarityRuleConfig(algorithm="jaro_winkler"),
+            threshold=1.0,
+            max_points=10.0,
+        )
+        rubric = Rubric(name="Test", rules=[rule])
+        result = grade(rubric, [Submission(student_id="s1", answers={})])
+        assert result.results[0].total_points == 10.0
+        assert "100%" in result.results[0].grade_details[0].feedback
+
+    def test_duplicate_answers_scored_once(self, monkeypatch):
+        """Test that identical answers are scored once per grade() call."""
+        calls = []
+        levenshtein = processor._select_similarity_func("levenshtein")
+
+        def counting_similarity(algorithm):
+            def similarity(a, b):
+                calls.append(a)
+                return levenshtein(a, b)
+
+            return similarity
+
+        monkeypatch.setattr(processor, "_select_similarity_func", counting_similarity)
+        # Scorers capture the similarity function when built, so rebuild them
+        processor._build_scorer.cache_clear()
+        rule = SimilarityRule(
+            question_id="q1",
+            reference="The quick brown fox",
+            threshold=0.5,
+            max_points=10.0,
+        )
+        rubric = Rubric(name="Test", rules=[rule])
+        submissions = [
+            Submission(student_id="s1", answers={"q1": "The quick brown dog"}),
+            Submission(student_id="s2", answers={"q1": "The quick brown dog"}),
+            Submission(student_id="s3", answers={"q1": "A slow red fox"}),
+        ]
+        try:
+            result = grade(rubric, submissions)
+            details = [r.grade_details[0] for r in result.results]
+            assert details[0].feedback == details[1].feedback
+            assert len(calls) == 2
+
+            # The memo does not outlive the grade() call
+            grade(rubric, submissions[:1])
+            assert len(calls) == 3
+        finally:
+            processor._build_scorer.cache_clear()
+
     def test_below_threshold(self):
         """Test answer below similarity threshold."""
         rule = SimilarityRule(
@@ -12,25 +12,37 @@ Run with: pytest tests/test_cli.py -v
 """
 
 import csv
+import json
+import re
 
 import pytest
 import yaml
 from typer.testing import CliRunner
 
 from gradeflow_engine.cli import app as cli_app
+from gradeflow_engine.cli import grade as grade_cmd
+from gradeflow_engine.models import GradeOutput, StudentResult
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeDumper as _YamlDumper
+    from yaml import SafeLoader as _YamlLoader
 
-@pytest.fixture
-def runner():
-    """Create a CLI test runner."""
-    return CliRunner()
 
+def _dump_yaml(data, path):
+    """Write test data to a YAML file in one go using the LibYAML emitter when available."""
+    path.write_text(yaml.dump(data, Dumper=_YamlDumper))
 
-@pytest.fixture
-def sample_rubric(tmp_path):
-    """Create a sample rubric YAML file."""
-    # Create sample rubric
-    rubric_data = {
+
+def _load_yaml(path):
+    """Read a YAML file in one go and parse it with LibYAML when available."""
+    return yaml.load(path.read_text(), Loader=_YamlLoader)
+
+
+_SAMPLE_RUBRIC_YAML = yaml.dump(
+    {
         "name": "Test Rubric",
         "rules": [
             {
@@ -47,38 +59,12 @@ def sample_rubric(tmp_path):
                 "max_points": 5.0,
             },
         ],
-    }
+    },
+    Dumper=_YamlDumper,
+)
 
-    rubric_file = tmp_path / "rubric.yaml"
-    with open(rubric_file, "w") as f:
-        yaml.dump(rubric_data, f)
-
-    return rubric_file
-
-
-@pytest.fixture
-def sample_submissions(tmp_path):
-    """Create a sample submissions CSV file."""
-    submissions_data = [
-        {"student_id": "student1", "Q1": "Paris", "Q2": "9.8", "Q3": "A,C"},
-        {"student_id": "student2", "Q1": "paris", "Q2": "9.81", "Q3": "A"},
-        {"student_id": "student3", "Q1": "London", "Q2": "10.0", "Q3": "B"},
-        {"student_id": "student4", "Q1": "PARIS", "Q2": "9.75", "Q3": "A,C"},
-    ]
-
-    submissions_file = tmp_path / "submissions.csv"
-    with open(submissions_file, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=["student_id", "Q1", "Q2", "Q3"])
-        writer.writeheader()
-        writer.writerows(submissions_data)
-
-    return submissions_file
-
-
-@pytest.fixture
-def invalid_rubric(tmp_path):
-    """Create an invalid rubric file."""
-    invalid_data = {
+_INVALID_RUBRIC_YAML = yaml.dump(
+    {
         "name": "Invalid Rubric",
         "rules": [
             {
@@ -88,27 +74,218 @@ def invalid_rubric(tmp_path):
                 "max_points": 10.0,
             }
         ],
-    }
+    },
+    Dumper=_YamlDumper,
+)
+
+_SAMPLE_SCHEMA_YAML = yaml.dump(
+    {
+        "name": "Test Schema",
+        "questions": {
+            "Q1": {
+                "type": "CHOICE",
+                "options": ["Paris", "London", "Berlin"],
+                "allow_multiple": False,
+            },
+            "Q2": {
+                "type": "NUMERIC",
+            },
+            "Q3": {
+                "type": "TEXT",
+            },
+        },
+    },
+    Dumper=_YamlDumper,
+)
+
+_INVALID_SCHEMA_YAML = yaml.dump(
+    {
+        "name": "Invalid Schema",
+        "questions": {
+            "Q1": {
+                "type": "CHOICE",
+                "question_id": "Q1",
+                # Missing required field: options
+            }
+        },
+    },
+    Dumper=_YamlDumper,
+)
+
+# Only uses questions defined in _SAMPLE_SCHEMA_YAML
+_COMPATIBLE_RUBRIC_YAML = yaml.dump(
+    {
+        "name": "Compatible Rubric",
+        "rules": [
+            {
+                "type": "EXACT_MATCH",
+                "question_id": "Q3",
+                "answer": "Paris",
+                "max_points": 10.0,
+            },
+            {
+                "type": "NUMERIC_RANGE",
+                "question_id": "Q2",
+                "min_value": 9.0,
+                "max_value": 10.0,
+                "max_points": 5.0,
+            },
+        ],
+    },
+    Dumper=_YamlDumper,
+)
+
+_INCOMPATIBLE_RUBRIC_YAML = yaml.dump(
+    {
+        "name": "Incompatible Rubric",
+        "rules": [
+            {
+                "type": "EXACT_MATCH",
+                "question_id": "Q99",  # Question not in schema
+                "answer": "Paris",
+                "max_points": 10.0,
+            }
+        ],
+    },
+    Dumper=_YamlDumper,
+)
+
+_MALFORMED_RUBRIC_YAML = "name: Test\nrules:\n  - type: EXACT_MATCH\n    invalid yaml here [[["
+
+_SAMPLE_SUBMISSIONS_CSV = """\
+student_id,Q1,Q2,Q3
+student1,Paris,9.8,"A,C"
+student2,paris,9.81,A
+student3,London,10.0,B
+student4,PARIS,9.75,"A,C"
+"""
 
-    rubric_file = tmp_path / "invalid_rubric.yaml"
-    with open(rubric_file, "w") as f:
-        yaml.dump(invalid_data, f)
+# More students than the CLI summary table shows (it lists the first 10)
+_MANY_SUBMISSIONS_CSV = "".join(
+    ["student_id,Q1,Q2,Q3\n"] + [f'student{i},Paris,9.8,"A,C"\n' for i in range(15)]
+)
+
+
+def _grade_in_process(rubric, submissions, output, output_type):
+    """Run the grade command directly, skipping Click argument parsing.
+
+    Used by happy-path output tests; argument handling and exit codes are
+    still exercised through the runner.
+    """
+    grade_cmd(
+        rubric=rubric,
+        submissions=submissions,
+        output=output,
+        output_type=output_type,
+        student_id_col="student_id",
+    )
+
+
+def _skip_rules(rubric, submissions, progress_callback=None):
+    """Stand-in for the grading pipeline that scores every submission as zero.
+
+    For CLI tests that only check loading, exporting and the summary table.
+    """
+    return GradeOutput(
+        results=[
+            StudentResult(
+                student_id=submission.student_id,
+                total_points=0.0,
+                max_points=0.0,
+                percentage=0.0,
+                grade_details=[],
+            )
+            for submission in submissions
+        ],
+        metadata={"rubric_name": rubric.name, "total_submissions": len(submissions)},
+    )
 
-    return rubric_file
+
+@pytest.fixture
+def skip_rules(monkeypatch):
+    """Make the CLI skip rule evaluation for tests that only need it to succeed."""
+    monkeypatch.setattr("gradeflow_engine.cli.grade_submissions", _skip_rules)
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """Create a CLI test runner shared by all tests.
+
+    Unexpected exceptions propagate instead of being folded into exit code 1.
+    """
+    return CliRunner(catch_exceptions=False)
+
+
+@pytest.fixture(scope="session")
+def rubric_file(tmp_path_factory):
+    """Create a valid sample rubric YAML file (shared; tests must not modify it)."""
+    path = tmp_path_factory.mktemp("rubrics") / "rubric.yaml"
+    path.write_text(_SAMPLE_RUBRIC_YAML)
+    return path
+
+
+@pytest.fixture(scope="session")
+def invalid_rubric_file(tmp_path_factory):
+    """Create a rubric YAML file missing a required rule field (shared; read-only)."""
+    path = tmp_path_factory.mktemp("rubrics") / "invalid_rubric.yaml"
+    path.write_text(_INVALID_RUBRIC_YAML)
+    return path
+
+
+@pytest.fixture(scope="session")
+def malformed_rubric_file(tmp_path_factory):
+    """Create a rubric file that is not valid YAML (shared; read-only)."""
+    path = tmp_path_factory.mktemp("rubrics") / "malformed_rubric.yaml"
+    path.write_text(_MALFORMED_RUBRIC_YAML)
+    return path
+
+
+@pytest.fixture(scope="session")
+def sample_submissions(tmp_path_factory):
+    """Create a sample submissions CSV file (shared; tests must not modify it)."""
+    submissions_file = tmp_path_factory.mktemp("submissions") / "submissions.csv"
+    submissions_file.write_text(_SAMPLE_SUBMISSIONS_CSV)
+    return submissions_file
+
+
+@pytest.fixture(scope="session")
+def many_submissions(tmp_path_factory):
+    """Create a 15-student submissions CSV (shared; tests must not modify it)."""
+    submissions_file = tmp_path_factory.mktemp("submissions") / "many_submissions.csv"
+    submissions_file.write_text(_MANY_SUBMISSIONS_CSV)
+    return submissions_file
+
+
+@pytest.fixture(scope="session")
+def graded_output(runner, rubric_file, sample_submissions, tmp_path_factory):
+    """Grade the sample files once through the CLI and share the run.
+
+    Returns the CliRunner result and the path of the YAML results file; tests
+    must treat both as read-only.
+    """
+    output_file = tmp_path_factory.mktemp("grade") / "results.yaml"
+    result = runner.invoke(
+        cli_app,
+        [
+            "grade",
+            str(rubric_file),
+            str(sample_submissions),
+            "--out",
+            str(output_file),
+            "--type",
+            "yaml",
+        ],
+    )
+    return result, output_file
 
 
 class TestVersionCommand:
     """Test the --version command."""
 
-    def test_version_short_flag(self, runner):
-        """Test version display with -v flag."""
-        result = runner.invoke(cli_app, ["-v"])
-        assert result.exit_code == 0
-        assert "gradeflow-engine version" in result.stdout
-
-    def test_version_long_flag(self, runner):
-        """Test version display with --version flag."""
-        result = runner.invoke(cli_app, ["--version"])
+    @pytest.mark.parametrize("flag", ["-v", "--version"])
+    def test_version_flag(self, runner, flag):
+        """Test version display with the short and long flags."""
+        result = runner.invoke(cli_app, [flag])
         assert result.exit_code == 0
         assert "gradeflow-engine version" in result.stdout
 
@@ -116,140 +293,69 @@ class TestVersionCommand:
 class TestGradeCommand:
     """Test the grade command."""
 
-    def test_grade_basic(self, runner, sample_rubric, sample_submissions, tmp_path):
+    def test_grade_basic(self, graded_output):
         """Test basic grading with minimal options."""
-        output_file = tmp_path / "results.yaml"
-
-        result = runner.invoke(
-            cli_app,
-            [
-                "grade",
-                str(sample_rubric),
-                str(sample_submissions),
-                "--out",
-                str(output_file),
-                "--type",
-                "yaml",
-            ],
-        )
+        result, output_file = graded_output
 
         assert result.exit_code == 0
         assert output_file.exists()
 
         # Verify output structure
-        with open(output_file) as f:
-            output = yaml.safe_load(f)
+        output = _load_yaml(output_file)
 
         assert "results" in output
         assert "metadata" in output
         assert output["metadata"]["rubric_name"] == "Test Rubric"
         assert len(output["results"]) == 4
 
-    def test_grade_with_csv_summary(self, runner, sample_rubric, sample_submissions, tmp_path):
-        """Test grading with CSV summary output."""
-        csv_summary = tmp_path / "summary.csv"
-
-        result = runner.invoke(
-            cli_app,
-            [
-                "grade",
-                str(sample_rubric),
-                str(sample_submissions),
-                "--out",
-                str(csv_summary),
-                "--type",
-                "csv.summary",
-            ],
-        )
-
-        assert result.exit_code == 0
-        assert csv_summary.exists()
-
-        # Verify CSV structure
-        with open(csv_summary) as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-
-        assert len(rows) == 4
-        assert "student_id" in rows[0]
-        assert "total_points" in rows[0]
-        assert "max_points" in rows[0]
-
-    def test_grade_with_csv_detailed(self, runner, sample_rubric, sample_submissions, tmp_path):
-        """Test grading with detailed CSV output."""
-        csv_detailed = tmp_path / "detailed.csv"
-
-        result = runner.invoke(
-            cli_app,
-            [
-                "grade",
-                str(sample_rubric),
-                str(sample_submissions),
-                "--out",
-                str(csv_detailed),
-                "--type",
-                "csv.detailed",
-            ],
-        )
+    @pytest.mark.parametrize(
+        "output_type,expected_columns",
+        [
+            pytest.param("csv.summary", {"student_id", "total_points", "max_points"}, id="summary"),
+            # Flattened per-student CSV with question-specific columns
+            pytest.param("csv.detailed", {"student_id", "Q1 answer", "Q2 answer"}, id="detailed"),
+            # Canvas columns default to ["SIS User ID", <rubric name>]
+            pytest.param("csv.canvas", {"SIS User ID", "Test Rubric"}, id="canvas"),
+        ],
+    )
+    def test_grade_with_csv_export(
+        self, rubric_file, sample_submissions, tmp_path, output_type, expected_columns
+    ):
+        """Test grading with each CSV export type."""
+        output_file = tmp_path / "results.csv"
 
-        assert result.exit_code == 0
-        assert csv_detailed.exists()
+        _grade_in_process(rubric_file, sample_submissions, output_file, output_type)
+        assert output_file.exists()
 
-        # Verify CSV has detailed columns
-        with open(csv_detailed) as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
+        with open(output_file, newline="") as f:
+            header, *rows = csv.reader(f)
 
-        # Detailed CSV is a flattened per-student CSV with question-specific columns
-        # Expect one row per student (4 rows)
+        # One row per student
         assert len(rows) == 4
-        # Should have question-specific column headers like 'Q1 answer'
-        assert any(col.endswith("answer") for col in rows[0].keys())
+        assert expected_columns <= set(header)
 
-    def test_grade_with_canvas_export(self, runner, sample_rubric, sample_submissions, tmp_path):
-        """Test grading with Canvas CSV export."""
-        canvas_file = tmp_path / "canvas.csv"
+    def test_grade_with_json_export(self, rubric_file, sample_submissions, tmp_path):
+        """Test grading with JSON output."""
+        output_file = tmp_path / "results.json"
 
-        result = runner.invoke(
-            cli_app,
-            [
-                "grade",
-                str(sample_rubric),
-                str(sample_submissions),
-                "--out",
-                str(canvas_file),
-                "--type",
-                "csv.canvas",
-            ],
-        )
+        _grade_in_process(rubric_file, sample_submissions, output_file, "json")
 
-        assert result.exit_code == 0
-        assert canvas_file.exists()
-
-        # Verify Canvas format
-        with open(canvas_file) as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-
-        assert len(rows) == 4
-        # Canvas format has columns: [student_id_field, assignment_name]
-        # By default: ["SIS User ID", "Test Rubric"]
-        assert "SIS User ID" in rows[0]
-        assert "Test Rubric" in rows[0]
+        output = json.loads(output_file.read_bytes())
+        assert output["metadata"]["rubric_name"] == "Test Rubric"
+        assert [r["student_id"] for r in output["results"]] == [
+            "student1",
+            "student2",
+            "student3",
+            "student4",
+        ]
 
-    def test_grade_custom_student_id_column(self, runner, sample_rubric, tmp_path):
+    def test_grade_custom_student_id_column(self, runner, rubric_file, tmp_path):
         """Test grading with custom student ID column name."""
         # Create submissions with custom column name
-        submissions_data = [
-            {"StudentID": "student1", "Q1": "Paris", "Q2": "9.8", "Q3": "A,C"},
-            {"StudentID": "student2", "Q1": "paris", "Q2": "9.81", "Q3": "A"},
-        ]
-
         submissions_file = tmp_path / "submissions_custom.csv"
-        with open(submissions_file, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=["StudentID", "Q1", "Q2", "Q3"])
-            writer.writeheader()
-            writer.writerows(submissions_data)
+        submissions_file.write_text(
+            'StudentID,Q1,Q2,Q3\nstudent1,Paris,9.8,"A,C"\nstudent2,paris,9.81,A\n'
+        )
 
         output_file = tmp_path / "results.yaml"
 
@@ -257,7 +363,7 @@ class TestGradeCommand:
             cli_app,
             [
                 "grade",
-                str(sample_rubric),
+                str(rubric_file),
                 str(submissions_file),
                 "--out",
                 str(output_file),
@@ -271,70 +377,14 @@ class TestGradeCommand:
         assert result.exit_code == 0
         assert output_file.exists()
 
-        with open(output_file) as f:
-            results = yaml.safe_load(f)
-
-        assert len(results["results"]) == 2
+        # A line scan is enough to check which students were graded
+        student_ids = re.findall(r"^- student_id: (\S+)$", output_file.read_text(), re.M)
+        assert student_ids == ["student1", "student2"]
 
-    def test_grade_nonexistent_rubric(self, runner, sample_submissions, tmp_path):
-        """Test grading with nonexistent rubric file."""
-        output_file = tmp_path / "results.yaml"
-
-        result = runner.invoke(
-            cli_app,
-            [
-                "grade",
-                "nonexistent_rubric.yaml",
-                str(sample_submissions),
-                "--out",
-                str(output_file),
-            ],
-        )
-
-        assert result.exit_code != 0
-
-    def test_grade_nonexistent_submissions(self, runner, sample_rubric, tmp_path):
-        """Test grading with nonexistent submissions file."""
-        output_file = tmp_path / "results.yaml"
-
-        result = runner.invoke(
-            cli_app,
-            [
-                "grade",
-                str(sample_rubric),
-                "nonexistent_submissions.csv",
-                "--out",
-                str(output_file),
-            ],
-        )
-
-        assert result.exit_code != 0
-
-    def test_grade_invalid_rubric(self, runner, invalid_rubric, sample_submissions, tmp_path):
-        """Test grading with invalid rubric."""
-        # An invalid rubric should cause the grading command to fail
-        output_file = tmp_path / "results.yaml"
-        result = runner.invoke(
-            cli_app,
-            [
-                "grade",
-                str(invalid_rubric),
-                str(sample_submissions),
-                "--out",
-                str(output_file),
-                "--type",
-                "yaml",
-            ],
-        )
-
-        assert result.exit_code != 0
-
-    def test_grade_empty_submissions(self, runner, sample_rubric, tmp_path):
+    def test_grade_empty_submissions(self, runner, rubric_file, tmp_path):
         """Test grading when submissions file is empty (header only)."""
         empty_submissions = tmp_path / "empty.csv"
-        with open(empty_submissions, "w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["student_id", "Q1", "Q2", "Q3"])
+        empty_submissions.write_text("student_id,Q1,Q2,Q3\n")
 
         output_file = tmp_path / "results.yaml"
 
@@ -342,7 +392,7 @@ class TestGradeCommand:
             cli_app,
             [
                 "grade",
-                str(sample_rubric),
+                str(rubric_file),
                 str(empty_submissions),
                 "--out",
                 str(output_file),
@@ -351,100 +401,68 @@ class TestGradeCommand:
             ],
         )
 
-        # Should succeed with empty results
+        # Should succeed with empty results, without starting the progress display
         assert result.exit_code == 0
+        out = result.stdout
+        assert "No submissions to grade" in out
+        assert "Grading 0 submissions" not in out
         assert output_file.exists()
 
 
 class TestValidateRubricCommand:
     """Test the validate-rubric command."""
 
-    def test_validate_valid_rubric(self, runner, sample_rubric):
+    def test_validate_valid_rubric(self, runner, rubric_file):
         """Test validating a valid rubric."""
-        result = runner.invoke(cli_app, ["validate-rubric", str(sample_rubric)])
+        result = runner.invoke(cli_app, ["validate-rubric", str(rubric_file)])
 
         assert result.exit_code == 0
         assert "Rubric is valid" in result.stdout
 
-    def test_validate_valid_rubric_verbose(self, runner, sample_rubric):
+    def test_validate_valid_rubric_verbose(self, runner, rubric_file):
         """Test validating a valid rubric with verbose output."""
-        result = runner.invoke(cli_app, ["validate-rubric", str(sample_rubric), "--verbose"])
+        result = runner.invoke(cli_app, ["validate-rubric", str(rubric_file), "--verbose"])
 
         assert result.exit_code == 0
-        assert "Rubric is valid" in result.stdout
-        assert "Rubric Details:" in result.stdout
-        assert "Rule Types:" in result.stdout
-        assert "EXACT_MATCH" in result.stdout
-
-    def test_validate_invalid_rubric(self, runner, invalid_rubric):
-        """Test validating an invalid rubric."""
-        result = runner.invoke(cli_app, ["validate-rubric", str(invalid_rubric)])
-
-        assert result.exit_code == 1
-        assert "Validation failed:" in result.stdout
-
-    def test_validate_nonexistent_rubric(self, runner):
-        """Test validating a nonexistent rubric file."""
-        result = runner.invoke(cli_app, ["validate-rubric", "nonexistent_rubric.yaml"])
-
-        assert result.exit_code != 0
-
-    def test_validate_malformed_yaml(self, runner, tmp_path):
-        """Test validating a malformed YAML file."""
-        malformed_file = tmp_path / "malformed.yaml"
-        with open(malformed_file, "w") as f:
-            f.write("name: Test\nrules:\n  - type: EXACT_MATCH\n    invalid yaml here [[[")
-
-        result = runner.invoke(cli_app, ["validate-rubric", str(malformed_file)])
-
-        assert result.exit_code == 1
+        out = result.stdout
+        assert "Rubric is valid" in out
+        assert "Rubric Details:" in out
+        assert "Rule Types:" in out
+        assert "EXACT_MATCH" in out
 
 
 class TestDisplaySummaryTable:
     """Test the summary table display functionality."""
 
-    def test_summary_table_with_results(self, runner, sample_rubric, sample_submissions, tmp_path):
+    def test_summary_table_with_results(self, graded_output):
         """Test that summary table is displayed for successful grading."""
-        output_file = tmp_path / "results.yaml"
-
-        result = runner.invoke(
-            cli_app,
-            ["grade", str(sample_rubric), str(sample_submissions), "--out", str(output_file)],
-        )
+        result, _ = graded_output
 
-        # Check for table headers in output (not in quiet mode)
         assert result.exit_code == 0
-        # The table might be displayed with Rich formatting
+        assert "Grading Summary" in result.stdout
 
-    def test_summary_table_truncation(self, runner, sample_rubric, tmp_path):
+    def test_summary_table_truncation(
+        self, runner, rubric_file, many_submissions, tmp_path, skip_rules
+    ):
         """Test that summary table truncates for many students."""
-        # Create submissions with more than 10 students
-        submissions_data = [
-            {"student_id": f"student{i}", "Q1": "Paris", "Q2": "9.8", "Q3": "A,C"}
-            for i in range(15)
-        ]
-
-        submissions_file = tmp_path / "many_submissions.csv"
-        with open(submissions_file, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=["student_id", "Q1", "Q2", "Q3"])
-            writer.writeheader()
-            writer.writerows(submissions_data)
-
         output_file = tmp_path / "results.yaml"
 
         result = runner.invoke(
-            cli_app, ["grade", str(sample_rubric), str(submissions_file), "--out", str(output_file)]
+            cli_app, ["grade", str(rubric_file), str(many_submissions), "--out", str(output_file)]
         )
 
         assert result.exit_code == 0
-        # Should show "..." for truncated results
+        out = result.stdout
+        assert "student9" in out
+        assert "student10" not in out
+        assert "..." in out
 
 
 class TestCLIEdgeCases:
     """Test edge cases and error conditions."""
 
     def test_grade_with_special_characters_in_path(
-        self, runner, sample_rubric, sample_submissions, tmp_path
+        self, runner, rubric_file, sample_submissions, tmp_path, skip_rules
     ):
         """Test grading with special characters in output path."""
         output_dir = tmp_path / "output with spaces"
@@ -455,7 +473,7 @@ class TestCLIEdgeCases:
             cli_app,
             [
                 "grade",
-                str(sample_rubric),
+                str(rubric_file),
                 str(sample_submissions),
                 "--out",
                 str(output_file),
@@ -468,55 +486,27 @@ class TestCLIEdgeCases:
         assert output_file.exists()
 
     def test_grade_creates_output_directory(
-        self, runner, sample_rubric, sample_submissions, tmp_path
+        self, rubric_file, sample_submissions, tmp_path, skip_rules
     ):
         """Test that grading creates output directory if it doesn't exist."""
         output_file = tmp_path / "new_dir" / "subdir" / "results.yaml"
 
-        result = runner.invoke(
-            cli_app,
-            [
-                "grade",
-                str(sample_rubric),
-                str(sample_submissions),
-                "--out",
-                str(output_file),
-                "--type",
-                "yaml",
-            ],
-        )
-
-        assert result.exit_code == 0
+        _grade_in_process(rubric_file, sample_submissions, output_file, "yaml")
         assert output_file.exists()
 
     def test_grade_overwrites_existing_output(
-        self, runner, sample_rubric, sample_submissions, tmp_path
+        self, rubric_file, sample_submissions, tmp_path, skip_rules
     ):
         """Test that grading overwrites existing output file."""
         output_file = tmp_path / "results.yaml"
 
         # Create existing file
-        with open(output_file, "w") as f:
-            f.write("old content")
+        output_file.write_text("old content")
 
-        result = runner.invoke(
-            cli_app,
-            [
-                "grade",
-                str(sample_rubric),
-                str(sample_submissions),
-                "--out",
-                str(output_file),
-                "--type",
-                "yaml",
-            ],
-        )
-
-        assert result.exit_code == 0
+        _grade_in_process(rubric_file, sample_submissions, output_file, "yaml")
 
         # Verify new content
-        with open(output_file) as f:
-            content = f.read()
+        content = output_file.read_text()
 
         assert "old content" not in content
         assert "results:" in content
@@ -530,51 +520,32 @@ class TestCLIEdgeCases:
         assert result.exit_code in [0, 2]  # 0 = success, 2 = usage error
         assert len(result.stderr) > 0  # Should show some output
 
-    def test_invalid_command(self, runner):
-        """Test running an invalid command."""
-        result = runner.invoke(cli_app, ["invalid-command"])
-
-        assert result.exit_code != 0
 
+class TestCLIErrorPaths:
+    """Test that invalid input makes CLI commands fail."""
 
-class TestCLIIntegration:
-    """Integration tests for CLI workflows."""
-
-    def test_validate_then_grade_workflow(
-        self, runner, sample_rubric, sample_submissions, tmp_path
+    @pytest.mark.parametrize("missing", ["rubric", "submissions"])
+    def test_grade_nonexistent_input(
+        self, runner, rubric_file, sample_submissions, tmp_path, missing
     ):
-        """Test workflow: validate rubric, then grade."""
-        # First validate
-        validate_result = runner.invoke(cli_app, ["validate-rubric", str(sample_rubric)])
-        assert validate_result.exit_code == 0
-
-        # Then grade
-        output_file = tmp_path / "results.yaml"
-        grade_result = runner.invoke(
+        """Test grading with a nonexistent rubric or submissions file."""
+        rubric = "nonexistent_rubric.yaml" if missing == "rubric" else str(rubric_file)
+        submissions = (
+            "nonexistent_submissions.csv" if missing == "submissions" else str(sample_submissions)
+        )
+        result = runner.invoke(
             cli_app,
-            [
-                "grade",
-                str(sample_rubric),
-                str(sample_submissions),
-                "--out",
-                str(output_file),
-                "--type",
-                "yaml",
-            ],
+            ["grade", rubric, submissions, "--out", str(tmp_path / "results.yaml")],
         )
-        assert grade_result.exit_code == 0
-        assert output_file.exists()
+        assert result.exit_code != 0
 
-    def test_multiple_output_formats_workflow(
-        self, runner, sample_rubric, sample_submissions, tmp_path
-    ):
-        """Test generating all output formats in one command."""
-        # Run primary YAML output first
+    def test_grade_invalid_rubric(self, runner, invalid_rubric_file, sample_submissions, tmp_path):
+        """Test grading with invalid rubric."""
         result = runner.invoke(
             cli_app,
             [
                 "grade",
-                str(sample_rubric),
+                str(invalid_rubric_file),
                 str(sample_submissions),
                 "--out",
                 str(tmp_path / "results.yaml"),
@@ -582,54 +553,48 @@ class TestCLIIntegration:
                 "yaml",
             ],
         )
-        assert result.exit_code == 0
+        assert result.exit_code != 0
 
-        result = runner.invoke(
-            cli_app,
-            [
-                "grade",
-                str(sample_rubric),
-                str(sample_submissions),
-                "--out",
-                str(tmp_path / "summary.csv"),
-                "--type",
-                "csv.summary",
-            ],
-        )
-        assert result.exit_code == 0
+    def test_validate_invalid_rubric(self, runner, invalid_rubric_file):
+        """Test validating an invalid rubric."""
+        result = runner.invoke(cli_app, ["validate-rubric", str(invalid_rubric_file)])
+        assert result.exit_code == 1
+        assert "Validation failed:" in result.stdout
 
-        result = runner.invoke(
-            cli_app,
-            [
-                "grade",
-                str(sample_rubric),
-                str(sample_submissions),
-                "--out",
-                str(tmp_path / "detailed.csv"),
-                "--type",
-                "csv.detailed",
-            ],
-        )
-        assert result.exit_code == 0
+    def test_validate_nonexistent_rubric(self, runner):
+        """Test validating a nonexistent rubric file."""
+        result = runner.invoke(cli_app, ["validate-rubric", "nonexistent_rubric.yaml"])
+        assert result.exit_code != 0
 
-        result = runner.invoke(
+    def test_validate_malformed_yaml(self, runner, malformed_rubric_file):
+        """Test validating a malformed YAML file."""
+        result = runner.invoke(cli_app, ["validate-rubric", str(malformed_rubric_file)])
+        assert result.exit_code == 1
+
+    def test_invalid_command(self, runner):
+        """Test running an invalid command."""
+        result = runner.invoke(cli_app, ["invalid-command"])
+        assert result.exit_code != 0
+
+
+class TestCLIIntegration:
+    """Integration tests for CLI workflows."""
+
+    def test_validate_then_grade_workflow(self, runner, rubric_file, sample_submissions, tmp_path):
+        """Test workflow: validate rubric, then grade."""
+        output_file = tmp_path / "results.yaml"
+
+        # First validate
+        validate_result = runner.invoke(cli_app, ["validate-rubric", str(rubric_file)])
+        assert validate_result.exit_code == 0
+
+        # Then grade the validated rubric
+        grade_result = runner.invoke(
             cli_app,
-            [
-                "grade",
-                str(sample_rubric),
-                str(sample_submissions),
-                "--out",
-                str(tmp_path / "canvas.csv"),
-                "--type",
-                "csv.canvas",
-            ],
+            ["grade", str(rubric_file), str(sample_submissions), "--out", str(output_file)],
         )
-        assert result.exit_code == 0
-
-        assert (tmp_path / "results.yaml").exists()
-        assert (tmp_path / "summary.csv").exists()
-        assert (tmp_path / "detailed.csv").exists()
-        assert (tmp_path / "canvas.csv").exists()
+        assert grade_result.exit_code == 0
+        assert output_file.exists()
 
 
 class TestInferSchemaCommand:
@@ -650,13 +615,13 @@ class TestInferSchemaCommand:
         )
 
         assert result.exit_code == 0
-        assert "Loaded 4 submissions" in result.stdout
-        assert "Inferred schema with 3 questions" in result.stdout
+        out = result.stdout
+        assert "Loaded 4 submissions" in out
+        assert "Inferred schema with 3 questions" in out
         assert output_file.exists()
 
         # Verify schema structure
-        with open(output_file) as f:
-            schema = yaml.safe_load(f)
+        schema = _load_yaml(output_file)
 
         assert "name" in schema
         assert "questions" in schema
@@ -684,10 +649,8 @@ class TestInferSchemaCommand:
         assert result.exit_code == 0
         assert output_file.exists()
 
-        with open(output_file) as f:
-            schema = yaml.safe_load(f)
-
-        assert schema["name"] == "My Custom Assessment"
+        # The structure is checked in test_infer_schema_basic; only the name matters here
+        assert re.search(r"^name: My Custom Assessment$", output_file.read_text(), re.M)
 
     def test_infer_schema_verbose(self, runner, sample_submissions, tmp_path):
         """Test schema inference with verbose output."""
@@ -705,23 +668,16 @@ class TestInferSchemaCommand:
         )
 
         assert result.exit_code == 0
-        assert "Schema Details:" in result.stdout
-        assert "Question Types:" in result.stdout
-        assert "Sample Questions:" in result.stdout
+        out = result.stdout
+        assert "Schema Details:" in out
+        assert "Question Types:" in out
+        assert "Sample Questions:" in out
 
     def test_infer_schema_custom_student_col(self, runner, tmp_path):
         """Test schema inference with custom student ID column."""
         # Create submissions with custom column name
-        submissions_data = [
-            {"StudentID": "student1", "Q1": "Paris", "Q2": "9.8"},
-            {"StudentID": "student2", "Q1": "London", "Q2": "9.81"},
-        ]
-
         submissions_file = tmp_path / "submissions_custom.csv"
-        with open(submissions_file, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=["StudentID", "Q1", "Q2"])
-            writer.writeheader()
-            writer.writerows(submissions_data)
+        submissions_file.write_text("StudentID,Q1,Q2\nstudent1,Paris,9.8\nstudent2,London,9.81\n")
 
         output_file = tmp_path / "schema.yaml"
 
@@ -759,10 +715,8 @@ class TestInferSchemaCommand:
     def test_infer_schema_empty_submissions(self, runner, tmp_path):
         """Test schema inference with empty submissions."""
         empty_submissions = tmp_path / "empty.csv"
-        with open(empty_submissions, "w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["student_id", "Q1", "Q2"])
-            # No data rows
+        # Header only, no data rows
+        empty_submissions.write_text("student_id,Q1,Q2\n")
 
         output_file = tmp_path / "schema.yaml"
 
@@ -784,99 +738,32 @@ class TestInferSchemaCommand:
 class TestValidateSchemaCommand:
     """Test the validate-schema command."""
 
-    @pytest.fixture
-    def sample_schema(self, tmp_path):
-        """Create a sample schema YAML file."""
-        schema_data = {
-            "name": "Test Schema",
-            "questions": {
-                "Q1": {
-                    "type": "CHOICE",
-                    "options": ["Paris", "London", "Berlin"],
-                    "allow_multiple": False,
-                },
-                "Q2": {
-                    "type": "NUMERIC",
-                },
-                "Q3": {
-                    "type": "TEXT",
-                },
-            },
-        }
-
-        schema_file = tmp_path / "schema.yaml"
-        with open(schema_file, "w") as f:
-            yaml.dump(schema_data, f)
-
+    @pytest.fixture(scope="class")
+    def sample_schema(self, tmp_path_factory):
+        """Create a sample schema YAML file (shared; tests must not modify it)."""
+        schema_file = tmp_path_factory.mktemp("schemas") / "schema.yaml"
+        schema_file.write_text(_SAMPLE_SCHEMA_YAML)
         return schema_file
 
-    @pytest.fixture
-    def invalid_schema(self, tmp_path):
-        """Create an invalid schema file."""
-        invalid_data = {
-            "name": "Invalid Schema",
-            "questions": {
-                "Q1": {
-                    "type": "CHOICE",
-                    "question_id": "Q1",
-                    # Missing required field: options
-                }
-            },
-        }
-
-        schema_file = tmp_path / "invalid_schema.yaml"
-        with open(schema_file, "w") as f:
-            yaml.dump(invalid_data, f)
-
+    @pytest.fixture(scope="class")
+    def invalid_schema(self, tmp_path_factory):
+        """Create an invalid schema file (shared; tests must not modify it)."""
+        schema_file = tmp_path_factory.mktemp("schemas") / "invalid_schema.yaml"
+        schema_file.write_text(_INVALID_SCHEMA_YAML)
         return schema_file
 
-    @pytest.fixture
-    def compatible_rubric(self, tmp_path):
-        """Create a rubric compatible with sample_schema."""
-        rubric_data = {
-            "name": "Compatible Rubric",
-            "rules": [
-                {
-                    "type": "EXACT_MATCH",
-                    "question_id": "Q3",
-                    "answer": "Paris",
-                    "max_points": 10.0,
-                },
-                {
-                    "type": "NUMERIC_RANGE",
-                    "question_id": "Q2",
-                    "min_value": 9.0,
-                    "max_value": 10.0,
-                    "max_points": 5.0,
-                },
-            ],
-        }
-
-        rubric_file = tmp_path / "compatible_rubric.yaml"
-        with open(rubric_file, "w") as f:
-            yaml.dump(rubric_data, f)
-
+    @pytest.fixture(scope="class")
+    def compatible_rubric(self, tmp_path_factory):
+        """Create a rubric compatible with sample_schema (shared; read-only)."""
+        rubric_file = tmp_path_factory.mktemp("rubrics") / "compatible_rubric.yaml"
+        rubric_file.write_text(_COMPATIBLE_RUBRIC_YAML)
         return rubric_file
 
-    @pytest.fixture
-    def incompatible_rubric(self, tmp_path):
-        """Create a rubric incompatible with sample_schema."""
-        rubric_data = {
-            "name": "Incompatible Rubric",
-            "rules": [
-                {
-                    "type": "EXACT_MATCH",
-                    "question_id": "Q99",  # Question not in schema
-                    "answer": "Paris",
-                    "max_points": 10.0,
-                }
-            ],
-        }
-
-        rubric_file = tmp_path / "incompatible_rubric.yaml"
-        with open(rubric_file, "w") as f:
-            yaml.dump(rubric_data, f)
-
+    @pytest.fixture(scope="class")
+    def incompatible_rubric(self, tmp_path_factory):
+        """Create a rubric incompatible with sample_schema (shared; read-only)."""
+        rubric_file = tmp_path_factory.mktemp("rubrics") / "incompatible_rubric.yaml"
+        rubric_file.write_text(_INCOMPATIBLE_RUBRIC_YAML)
         return rubric_file
 
     def test_validate_schema_basic(self, runner, sample_schema):
@@ -897,9 +784,10 @@ class TestValidateSchemaCommand:
         )
 
         assert result.exit_code == 0
-        assert "Schema is valid" in result.stdout
-        assert "Schema Details:" in result.stdout
-        assert "Question Types:" in result.stdout
+        out = result.stdout
+        assert "Schema is valid" in out
+        assert "Schema Details:" in out
+        assert "Question Types:" in out
 
     def test_validate_schema_with_compatible_rubric(self, runner, sample_schema, compatible_rubric):
         """Test schema validation with compatible rubric."""
@@ -913,11 +801,10 @@ class TestValidateSchemaCommand:
             ],
         )
 
-        print(result.stdout)
-
         assert result.exit_code == 0
-        assert "Schema is valid" in result.stdout
-        assert "Rubric is valid against schema" in result.stdout
+        out = result.stdout
+        assert "Schema is valid" in out
+        assert "Rubric is valid against schema" in out
 
     def test_validate_schema_with_incompatible_rubric(
         self, runner, sample_schema, incompatible_rubric
@@ -934,8 +821,9 @@ class TestValidateSchemaCommand:
         )
 
         assert result.exit_code == 1
-        assert "Validation failed" in result.stdout
-        assert "Q99" in result.stdout or "not found" in result.stdout
+        out = result.stdout
+        assert "Validation failed" in out
+        assert "Q99" in out or "not found" in out
 
     def test_validate_invalid_schema(self, runner, invalid_schema):
         """Test validating an invalid schema."""
@@ -999,7 +887,7 @@ class TestSchemaWorkflows:
         assert "Schema is valid" in validate_result.stdout
 
     def test_infer_validate_with_rubric_workflow(
-        self, runner, sample_submissions, sample_rubric, tmp_path
+        self, runner, sample_submissions, rubric_file, tmp_path
     ):
         """Test workflow: infer schema, validate rubric against it."""
         schema_file = tmp_path / "schema.yaml"
@@ -1023,7 +911,7 @@ class TestSchemaWorkflows:
                 "validate-schema",
                 str(schema_file),
                 "--rubric",
-                str(sample_rubric),
+                str(rubric_file),
             ],
         )
         # This might pass or fail depending on rubric/schema compatibility
@@ -1060,8 +948,7 @@ class TestSchemaWorkflows:
                 }
             ],
         }
-        with open(rubric_file, "w") as f:
-            yaml.dump(rubric_data, f)
+        _dump_yaml(rubric_data, rubric_file)
 
         # Step 3: Validate rubric against schema
         validate_result = runner.invoke(
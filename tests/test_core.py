@@ -13,8 +13,10 @@ from gradeflow_engine import (
     ExactMatchRule,
     LengthRule,
     NumericRangeRule,
+    ProgrammableRule,
     Rubric,
     Submission,
+    core,
     grade,
     grade_from_files,
 )
@@ -23,25 +25,45 @@ from gradeflow_engine.io import save_rubric
 
 def save_submissions_to_csv(submissions, file_path):
     """Helper to save submissions to CSV."""
+    questions = sorted({q for sub in submissions for q in sub.answers})
+    # Column position of each question, resolved once rather than per row
+    column = {q: i for i, q in enumerate(questions, start=1)}
+
     with open(file_path, "w", newline="", encoding="utf-8") as f:
-        if not submissions:
-            writer = csv.writer(f)
-            writer.writerow(["student_id"])
-            return
+        writer = csv.writer(f)
+        writer.writerow(["student_id", *questions])
 
-        # Get all question IDs
-        all_questions = set()
         for sub in submissions:
-            all_questions.update(sub.answers.keys())
+            row = [""] * (len(questions) + 1)
+            row[0] = sub.student_id
+            for q, answer in sub.answers.items():
+                row[column[q]] = answer
+            writer.writerow(row)
 
-        fieldnames = ["student_id"] + sorted(all_questions)
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
 
-        for sub in submissions:
-            row = {"student_id": sub.student_id}
-            row.update(sub.answers)
-            writer.writerow(row)
+def _exact_match_rubric(question_id="Q1"):
+    """Rubric awarding 10 points for answering "A" to question_id."""
+    return Rubric(
+        name="Test",
+        rules=[ExactMatchRule(question_id=question_id, answer="A", max_points=10.0)],
+    )
+
+
+def _numeric_range_rubric(unit):
+    """Rubric awarding 10 points for a "q1" answer in [9, 11] with the given unit."""
+    return Rubric(
+        name="Test",
+        rules=[
+            NumericRangeRule(
+                question_id="q1",
+                min_value=9.0,
+                max_value=11.0,
+                max_points=10.0,
+                description="Test",
+                unit=unit,
+            )
+        ],
+    )
 
 
 class TestGradeFunction:
@@ -49,15 +71,11 @@ class TestGradeFunction:
 
     def test_grade_simple(self):
         """Test simple grading."""
-        rubric = Rubric(
-            name="Test",
-            rules=[ExactMatchRule(question_id="Q1", answer="A", max_points=10)],
-        )
         submissions = [
             Submission(student_id="s1", answers={"Q1": "A"}),
             Submission(student_id="s2", answers={"Q1": "B"}),
         ]
-        result = grade(rubric, submissions)
+        result = grade(_exact_match_rubric(), submissions)
         assert len(result.results) == 2
         assert result.results[0].total_points == 10
         assert result.results[1].total_points == 0
@@ -83,19 +101,54 @@ class TestGradeFunction:
         # Should get points from the numeric rule
         assert result.results[0].total_points > 0
 
+    def test_grade_parallel_matches_sequential(self, monkeypatch):
+        """Test that parallel grading returns the same results in submission order."""
+        # Force the pool path for a small batch
+        monkeypatch.setattr(core, "_MIN_BATCH_FOR_POOL", 1)
+        rubric = Rubric(
+            name="Test",
+            rules=[
+                ExactMatchRule(question_id="Q1", answer="A", max_points=10),
+                ProgrammableRule(
+                    question_id="Q1",
+                    code="points_awarded = 1.0 if answer == 'A' else 0.5",
+                    max_points=1.0,
+                ),
+            ],
+        )
+        submissions = [
+            Submission(student_id=f"s{i}", answers={"Q1": "A" if i % 2 == 0 else "B"})
+            for i in range(20)
+        ]
+        progress_calls = []
+
+        sequential = grade(rubric, submissions)
+        parallel = grade(
+            rubric,
+            submissions,
+            progress_callback=lambda current, total: progress_calls.append((current, total)),
+            workers=2,
+        )
+
+        assert parallel.results == sequential.results
+        assert [r.total_points for r in parallel.results] == [11.0, 0.5] * 10
+        assert [r.student_id for r in parallel.results] == [f"s{i}" for i in range(20)]
+        assert progress_calls[-1] == (20, 20)
+
+    def test_grade_invalid_workers(self):
+        """Test that a non-positive worker count is rejected."""
+        rubric = Rubric(name="Test", rules=[])
+        with pytest.raises(ValueError, match="workers"):
+            grade(rubric, [], workers=0)
+
 
 class TestGradeFromFiles:
     """Test grade_from_files() function."""
 
     def test_grade_from_files_basic(self, tmp_path):
         """Test grading from files with basic setup."""
-        # Create rubric file
-        rubric = Rubric(
-            name="Test",
-            rules=[ExactMatchRule(question_id="Q1", answer="A", max_points=10)],
-        )
         rubric_path = tmp_path / "rubric.yaml"
-        save_rubric(rubric, str(rubric_path))
+        save_rubric(_exact_match_rubric(), str(rubric_path))
 
         # Create submissions file
         submissions = [
@@ -113,12 +166,8 @@ class TestGradeFromFiles:
 
     def test_grade_from_files_custom_student_col(self, tmp_path):
         """Test grading from files with custom student ID column."""
-        rubric = Rubric(
-            name="Test",
-            rules=[ExactMatchRule(question_id="Q1", answer="A", max_points=10)],
-        )
         rubric_path = tmp_path / "rubric.yaml"
-        save_rubric(rubric, str(rubric_path))
+        save_rubric(_exact_match_rubric(), str(rubric_path))
 
         # Create CSV with custom column name
         csv_path = tmp_path / "submissions.csv"
@@ -137,12 +186,8 @@ class TestGradeFromFiles:
 
     def test_grade_from_files_missing_submissions(self, tmp_path):
         """Test grading from files with missing submissions."""
-        rubric = Rubric(
-            name="Test",
-            rules=[ExactMatchRule(question_id="Q1", answer="A", max_points=10)],
-        )
         rubric_path = tmp_path / "rubric.yaml"
-        save_rubric(rubric, str(rubric_path))
+        save_rubric(_exact_match_rubric(), str(rubric_path))
 
         with pytest.raises(FileNotFoundError):
             grade_from_files(str(rubric_path), "nonexistent.csv")
@@ -189,11 +234,6 @@ class TestErrorHandling:
 
     def test_progress_callback_exception(self):
         """Test that exceptions in progress callback are handled gracefully."""
-        rubric = Rubric(
-            name="Test",
-            rules=[ExactMatchRule(question_id="q1", answer="A", max_points=10.0)],
-        )
-
         submissions = [
             Submission(student_id="s1", answers={"q1": "A"}),
             Submission(student_id="s2", answers={"q1": "B"}),
@@ -203,42 +243,23 @@ class TestErrorHandling:
             raise RuntimeError("Callback failed!")
 
         # Should complete successfully despite callback failure
-        result = grade(rubric, submissions, progress_callback=failing_callback)
+        result = grade(_exact_match_rubric("q1"), submissions, progress_callback=failing_callback)
 
         assert len(result.results) == 2
         assert result.results[0].total_points == 10.0
 
     def test_rule_processing_with_missing_answer(self):
         """Test handling when student doesn't provide an answer."""
-        rubric = Rubric(
-            name="Test",
-            rules=[
-                NumericRangeRule(
-                    question_id="q1",
-                    min_value=9.0,
-                    max_value=11.0,
-                    max_points=10.0,
-                    description="Test",
-                    unit="cm",
-                )
-            ],
-        )
-
         # Missing answer should result in 0 points
         submission = Submission(student_id="s1", answers={})
-        result = grade(rubric, [submission])
+        result = grade(_numeric_range_rubric("cm"), [submission])
 
         assert result.results[0].total_points == 0.0
         assert len(result.results[0].grade_details) == 1
 
     def test_empty_submissions_list(self):
         """Test grading with empty submissions list."""
-        rubric = Rubric(
-            name="Test",
-            rules=[ExactMatchRule(question_id="q1", answer="A", max_points=10.0)],
-        )
-
-        result = grade(rubric, [])
+        result = grade(_exact_match_rubric("q1"), [])
 
         assert len(result.results) == 0
         assert result.metadata["total_submissions"] == 0
@@ -292,20 +313,6 @@ class TestProgressCallback:
 
     def test_progress_callback_with_mixed_results(self):
         """Test that progress callback continues even with invalid answers."""
-        rubric = Rubric(
-            name="Test",
-            rules=[
-                NumericRangeRule(
-                    question_id="q1",
-                    min_value=9.0,
-                    max_value=11.0,
-                    max_points=10.0,
-                    description="Test",
-                    unit="units",
-                )
-            ],
-        )
-
         # Mix of valid and invalid numeric answers
         submissions = [
             Submission(student_id="s1", answers={"q1": "10"}),
@@ -318,7 +325,9 @@ class TestProgressCallback:
         def progress_callback(current, total):
             progress_calls.append((current, total))
 
-        result = grade(rubric, submissions, progress_callback=progress_callback)
+        result = grade(
+            _numeric_range_rubric("units"), submissions, progress_callback=progress_callback
+        )
 
         assert len(result.results) == 3
         assert len(progress_calls) == 3
@@ -5,6 +5,7 @@ Run with: pytest tests/test_io.py -v
 """
 
 import csv
+import json
 
 import pytest
 import yaml
@@ -19,6 +20,7 @@ from gradeflow_engine import (
 from gradeflow_engine.exports import (
     CanvasExportConfig,
     DetailedCsvExportConfig,
+    JsonExportConfig,
     SummaryCsvExportConfig,
     YamlExportConfig,
 )
@@ -37,6 +39,11 @@ from gradeflow_engine.schema import (
     TextQuestionSchema,
 )
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader as _YamlLoader
+
 
 class TestLoadRubric:
     """Test rubric loading from YAML."""
@@ -197,10 +204,18 @@ class TestSaveResults:
 
         # Verify content
         with open(output_path) as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
             assert len(data["results"]) == 1
             assert data["results"][0]["student_id"] == "student001"
 
+    def test_save_results_json(self, sample_results, tmp_path):
+        """Test saving results to JSON."""
+        output_path = tmp_path / "results.json"
+        export_results(sample_results, str(output_path), config=JsonExportConfig())
+
+        data = json.loads(output_path.read_text())
+        assert data == sample_results.model_dump(mode="json")
+
     def test_save_results_csv_summary(self, sample_results, tmp_path):
         """Test saving summary CSV."""
         output_path = tmp_path / "summary.csv"
@@ -23,6 +23,7 @@ from gradeflow_engine.sandbox import (
     SCRIPT_MAX_LINES,
     SandboxExecutionError,
     SandboxTimeoutError,
+    _compile_script,
     _create_restricted_globals,
     _extract_and_validate_results,
     _is_running_in_container,
@@ -394,6 +395,20 @@ feedback = "Correct answer!"
         assert points == 10.0
         assert feedback == "Correct answer!"
 
+    def test_execute_script_compiles_once(self):
+        """Test that repeated runs of the same script reuse the compiled code."""
+        script = "points_awarded = 10.0 if answer == 'A' else 0.0"
+        _compile_script.cache_clear()
+
+        for answer in ("A", "B", "A"):
+            execute_programmable_rule(
+                script=script, student_answers={"Q1": answer}, question_id="Q1", answer=answer
+            )
+
+        info = _compile_script.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
     def test_execute_script_with_logic(self):
         """Test executing script with conditional logic."""
         script = """